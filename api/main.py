@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 from ingest.refresh import (
     refresh_company_period
 )
 
 
+import httpx
+import orjson
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Query
-from pydantic import BaseModel, Field
-from openai import OpenAI
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from openai import DefaultHttpxClient, OpenAI
 
 # Load environment variables from .env file
 load_dotenv()
@@ -19,15 +23,16 @@ load_dotenv()
 from graph.db import get_neo4j_driver
 from graph.schema import ensure_schema
 from graph.queries import (
-    find_company_by_name,
+    find_company_by_name_or_ticker,
     get_claims_with_sources,
     get_sentiment_delta,
-    get_latest_fetch_by_type
+    get_signal_delta,
+    get_latest_fetches_for_periods,
 )
 from agent.freshness import (
     freshness_check
 )
-from extract.llm_entity import find_company_name_for_graph
+from extract.llm_entity import find_company_for_graph
 from utils.periods import get_default_periods
 from models.registry import (
     list_event_types_info,
@@ -38,8 +43,6 @@ from models.registry import (
     SignalType,
 )
 
-app = FastAPI(title="PulseGraph API", version="0.1.0")
-
 # -------------------------
 # Pydantic models
 # -------------------------
@@ -54,7 +57,13 @@ class AskRequest(BaseModel):
     event_type: str = Field("earnings", description="Type of event (default: earnings)")
 
 
+# Response models are built once and never mutated
+_RESPONSE_CONFIG = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
+
 class SourceOut(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     url: Optional[str] = None
     title: Optional[str] = None
     source_type: Optional[str] = None
@@ -63,6 +72,8 @@ class SourceOut(BaseModel):
 
 
 class ClaimOut(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     id: str
     text: str
     claim_type: Optional[str] = None
@@ -72,6 +83,8 @@ class ClaimOut(BaseModel):
 
 
 class SentimentSignalOut(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     id: Optional[str] = None
     score: Optional[float] = None
     volume: Optional[int] = None
@@ -80,6 +93,8 @@ class SentimentSignalOut(BaseModel):
 
 
 class SentimentDeltaOut(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     period_a: str
     period_b: str
     window: str
@@ -90,12 +105,16 @@ class SentimentDeltaOut(BaseModel):
 
 
 class FreshnessOut(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     was_stale: bool
     reason: str
     checked_at: str
 
 
 class AskResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     company: Dict[str, Any]
     period_a: str
     period_b: str
@@ -105,24 +124,58 @@ class AskResponse(BaseModel):
     freshness: FreshnessOut
 
 
+# Built once at import; validates a whole claims list in a single pydantic-core pass
+_CLAIMS_ADAPTER = TypeAdapter(List[ClaimOut])
+
+
 # -------------------------
 # App lifecycle: Neo4j driver
 # -------------------------
 
-@app.on_event("startup")
-def on_startup() -> None:
-    driver = get_neo4j_driver()
-    ensure_schema(driver)
-    app.state.neo4j_driver = driver
-    # Initialize OpenAI client for LLM-based entity extraction
-    app.state.openai_client = OpenAI()
+# One pooled HTTP client shared by every OpenAI call in the process
+# (entity extraction, query generation, claim extraction) so concurrent
+# requests reuse keep-alive connections instead of re-doing TLS.
+OPENAI_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Everything opened here is registered on the stack as soon as it exists,
+    # so a failure later in startup still closes what was already created
+    async with AsyncExitStack() as stack:
+        # DefaultHttpxClient keeps the SDK's timeout/redirect/transport
+        # defaults; only the pool size is overridden
+        http_client = stack.enter_context(DefaultHttpxClient(limits=OPENAI_HTTP_LIMITS))
+        # Connect to Neo4j and build the OpenAI client (used for LLM-based
+        # entity extraction) concurrently; both do blocking I/O / env parsing.
+        results = await asyncio.gather(
+            asyncio.to_thread(get_neo4j_driver),
+            asyncio.to_thread(OpenAI, http_client=http_client),
+            return_exceptions=True,
+        )
+        driver, openai_client = results
+        if not isinstance(driver, BaseException):
+            stack.callback(driver.close)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        await asyncio.to_thread(ensure_schema, driver)
+        app.state.neo4j_driver = driver
+        app.state.openai_client = openai_client
+        # Registries are static: serialize the type listings once per process
+        event_types = [info._asdict() for info in list_event_types_info()]
+        signal_types = [info._asdict() for info in list_signal_types_info()]
+        app.state.event_types_body = orjson.dumps(
+            {"event_types": event_types, "count": len(event_types)}
+        )
+        app.state.signal_types_body = orjson.dumps(
+            {"signal_types": signal_types, "count": len(signal_types)}
+        )
+        yield
 
 
-@app.on_event("shutdown")
-def on_shutdown() -> None:
-    driver = getattr(app.state, "neo4j_driver", None)
-    if driver is not None:
-        driver.close()
+app = FastAPI(title="PulseGraph API", version="0.1.0", lifespan=lifespan)
 
 
 # -------------------------
@@ -142,10 +195,7 @@ async def get_event_types():
     Returns:
         List of event types with metadata
     """
-    return {
-        "event_types": list_event_types_info(),
-        "count": len(list_event_types_info()),
-    }
+    return Response(content=app.state.event_types_body, media_type="application/json")
 
 
 @app.get("/signal-types")
@@ -156,10 +206,7 @@ async def get_signal_types():
     Returns:
         List of signal types with metadata
     """
-    return {
-        "signal_types": list_signal_types_info(),
-        "count": len(list_signal_types_info()),
-    }
+    return Response(content=app.state.signal_types_body, media_type="application/json")
 
 
 @app.post("/ask", response_model=AskResponse)
@@ -173,24 +220,28 @@ async def ask(payload: AskRequest, auto_refresh: bool = Query(False)):
         raise HTTPException(status_code=500, detail="OpenAI client not initialized")
 
     # 1) determine company using LLM-based entity extraction
-    company_name = payload.company
+    # An explicit `company` may be either a name or a ticker
+    company_name = ticker = payload.company
     if not company_name:
-        # Use LLM to extract company from question
-        company_name = find_company_name_for_graph(
+        # Use LLM to extract company from question (sync client; keep it off the event loop)
+        entity = await asyncio.to_thread(
+            find_company_for_graph,
             client=openai_client,
             question=payload.question,
             confidence_threshold=0.5,
         )
+        if entity:
+            company_name, ticker = entity.company_name, entity.ticker
 
-    if not company_name:
+    if not company_name and not ticker:
         raise HTTPException(
             status_code=400,
             detail="Could not infer company from question. Provide `company` in the request.",
         )
 
-    company = find_company_by_name(driver, company_name)
+    company = await asyncio.to_thread(find_company_by_name_or_ticker, driver, company_name, ticker)
     if not company:
-        raise HTTPException(status_code=404, detail=f"Company not found in graph: {company_name}")
+        raise HTTPException(status_code=404, detail=f"Company not found in graph: {company_name or ticker}")
 
     # 2) validate event and signal types
     if not validate_event_type(payload.event_type):
@@ -218,10 +269,13 @@ async def ask(payload: AskRequest, auto_refresh: bool = Query(False)):
     company_id = company["id"]
 
     # 4) freshness check (real, graph-backed)
-    latest_a = get_latest_fetch_by_type(driver, company_id, period_a)
-    latest_b = get_latest_fetch_by_type(driver, company_id, period_b)
+    # Graph reads use the sync driver; run them in threads so they don't
+    # block the event loop.
+    latest = await asyncio.to_thread(
+        get_latest_fetches_for_periods, driver, company_id, [period_a, period_b]
+    )
 
-    combined_latest = latest_a + latest_b
+    combined_latest = latest[period_a] + latest[period_b]
     freshness_raw = freshness_check(combined_latest)
 
     freshness = FreshnessOut(
@@ -236,39 +290,35 @@ async def ask(payload: AskRequest, auto_refresh: bool = Query(False)):
 
     refresh_log = None
     if freshness.was_stale and auto_refresh:
-        refresh_log = refresh_company_period(
+        refresh_log = await refresh_company_period(
             driver=driver,
+            llm_client=openai_client,
             company_id=company_id,
             company_name=company["name"],
             period=period_a,
             source_types=freshness_raw["stale_types"],
         )
 
-    # 5) query the graph
-    claims_a_raw = get_claims_with_sources(driver, company_id, period_a, limit=15)
-    claims_b_raw = get_claims_with_sources(driver, company_id, period_b, limit=15)
-
-    # Use generic signal delta (supports all signal types)
-    from graph.queries import get_signal_delta
-    sentiment_raw = get_signal_delta(
-        driver,
-        company_id,
-        period_a,
-        period_b,
-        window=payload.window,
-        signal_type=payload.signal_type,
+    # 5) query the graph (after any refresh so new claims are included)
+    claims_a_raw, claims_b_raw, sentiment_raw = await asyncio.gather(
+        asyncio.to_thread(get_claims_with_sources, driver, company_id, period_a, limit=15),
+        asyncio.to_thread(get_claims_with_sources, driver, company_id, period_b, limit=15),
+        # Use generic signal delta (supports all signal types)
+        asyncio.to_thread(
+            get_signal_delta,
+            driver,
+            company_id,
+            period_a,
+            period_b,
+            window=payload.window,
+            signal_type=payload.signal_type,
+        ),
     )
 
     # 6) shape response
-    def to_claim_out(row: Dict[str, Any]) -> ClaimOut:
-        sources = [SourceOut(**s) for s in (row.get("sources") or []) if s]
-        return ClaimOut(
-            id=row["id"],
-            text=row["text"],
-            claim_type=row.get("claim_type"),
-            confidence=row.get("confidence"),
-            last_updated_at=row.get("last_updated_at"),
-            sources=sources,
+    def to_claims_out(rows: List[Dict[str, Any]]) -> List[ClaimOut]:
+        return _CLAIMS_ADAPTER.validate_python(
+            [{**row, "sources": [s for s in (row.get("sources") or []) if s]} for row in rows]
         )
 
     def to_signal_out(sig: Optional[Dict[str, Any]]) -> Optional[SentimentSignalOut]:
@@ -292,12 +342,15 @@ async def ask(payload: AskRequest, auto_refresh: bool = Query(False)):
         note=sentiment_raw.get("note"),
     )
 
-    return AskResponse(
+    response = AskResponse(
         company=company,
         period_a=period_a,
         period_b=period_b,
         sentiment=sentiment,
-        claims_a=[to_claim_out(r) for r in claims_a_raw],
-        claims_b=[to_claim_out(r) for r in claims_b_raw],
+        claims_a=to_claims_out(claims_a_raw),
+        claims_b=to_claims_out(claims_b_raw),
         freshness=freshness,
-    )
\ No newline at end of file
+    )
+    # Serialize straight to JSON bytes in pydantic-core, skipping the
+    # response_model re-validation and jsonable_encoder pass
+    return Response(content=response.model_dump_json(), media_type="application/json")
\ No newline at end of file
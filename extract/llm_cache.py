@@ -0,0 +1,352 @@
+"""
+Content-addressable cache for deterministic LLM calls.
+
+Entity extraction and search query generation run at low temperature, so the
+same inputs produce (practically) the same structured output. Results are
+stored under a SHA-256 key of the call inputs and served from a local SQLite
+file on repeat calls, skipping the OpenAI round-trip and its token cost.
+
+SemanticCache extends this to paraphrases: values are keyed by an embedding
+of the input and returned for any new input whose embedding is close enough.
+It expires entries with the same TTL and keeps at most max_entries rows.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_CACHE_PATH = ".cache/llm_cache.sqlite3"
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_SIMILARITY_THRESHOLD = 0.92
+# ~30 MB of float32 vectors at 1536 dimensions (text-embedding-3-small)
+DEFAULT_SEMANTIC_MAX_ENTRIES = 5000
+
+
+def make_cache_key(fn: str, **params: Any) -> str:
+    """
+    Build a stable cache key from a logical function name and its inputs.
+
+    Example:
+        >>> key = make_cache_key("extract_company", model="gpt-4o-mini", question="NVDA?")
+        >>> len(key)
+        64
+    """
+    payload = json.dumps({"fn": fn, **params}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    SQLite-backed key/value cache with per-entry TTL.
+
+    Values must be JSON-serializable (e.g. model.model_dump(mode="json")).
+    Safe to share across threads. Storage errors are treated as cache misses
+    so a broken cache never fails the underlying LLM call.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing/expired."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row is None:
+            return None
+
+        value, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            return None
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = DEFAULT_TTL_SECONDS) -> None:
+        """Store value under key. ttl=None keeps the entry forever."""
+        expires_at = time.time() + ttl if ttl is not None else None
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), expires_at),
+                )
+                self._conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _normalize(embedding: Sequence[float]) -> np.ndarray:
+    vec = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm > 0 else vec
+
+
+class _EmbeddingIndex:
+    """
+    Unit-norm embeddings stored row-major in a growable float32 buffer.
+
+    Rows are normalized at insert time, so cosine similarity against a
+    normalized query is a single BLAS matrix-vector product. Rows are kept
+    in insertion (creation time) order.
+    """
+
+    __slots__ = ("vectors", "created_at", "values", "size")
+
+    def __init__(self, dim: int, capacity: int = 64):
+        self.vectors = np.empty((capacity, dim), dtype=np.float32)
+        self.created_at = np.empty(capacity, dtype=np.float64)
+        self.values: List[Any] = []
+        self.size = 0
+
+    def append(self, vec: np.ndarray, value: Any, created_at: float) -> None:
+        if self.size == self.vectors.shape[0]:
+            grown = np.empty((2 * self.size, self.vectors.shape[1]), dtype=np.float32)
+            grown[: self.size] = self.vectors
+            self.vectors = grown
+            grown_at = np.empty(2 * self.size, dtype=np.float64)
+            grown_at[: self.size] = self.created_at
+            self.created_at = grown_at
+        self.vectors[self.size] = vec
+        self.created_at[self.size] = created_at
+        self.values.append(value)
+        self.size += 1
+
+    def best_match(self, q: np.ndarray, min_created_at: Optional[float] = None) -> Tuple[float, Any]:
+        scores = self.vectors[: self.size] @ q
+        if min_created_at is not None:
+            scores[self.created_at[: self.size] < min_created_at] = -np.inf
+        best = int(np.argmax(scores))
+        return float(scores[best]), self.values[best]
+
+    def drop_before(self, cutoff: float) -> None:
+        """Drop rows created before cutoff (always a prefix, rows are in time order)."""
+        k = int(np.searchsorted(self.created_at[: self.size], cutoff, side="left"))
+        if k == 0:
+            return
+        n = self.size - k
+        self.vectors[:n] = self.vectors[k : self.size]
+        self.created_at[:n] = self.created_at[k : self.size]
+        del self.values[:k]
+        self.size = n
+
+
+class SemanticCache:
+    """
+    Nearest-neighbour cache keyed by embeddings (cosine similarity).
+
+    Entries are grouped by namespace (e.g. function + model) so unrelated
+    callers never match each other. Embeddings are persisted in SQLite next to
+    the exact-match cache and loaded into memory on startup.
+
+    Like LLMCache, entries older than ttl are never served (ttl=None keeps
+    them forever). At most max_entries rows are kept: past that, the oldest
+    tenth is evicted (together with anything expired) from memory and disk.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        ttl: Optional[float] = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_SEMANTIC_MAX_ENTRIES,
+    ):
+        self.path = str(path)
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS semantic_cache (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                namespace TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                value TEXT NOT NULL,
+                created_at REAL
+            )
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(semantic_cache)")}
+        if "created_at" not in columns:
+            # Written before entries were timestamped; those rows (NULL) are purged below
+            self._conn.execute("ALTER TABLE semantic_cache ADD COLUMN created_at REAL")
+
+        # Purge expired and overflow rows before loading, so startup cost and
+        # memory stay bounded by max_entries
+        min_created_at = self._min_created_at()
+        self._conn.execute(
+            "DELETE FROM semantic_cache WHERE created_at IS NULL OR created_at < ?",
+            (min_created_at if min_created_at is not None else float("-inf"),),
+        )
+        self._conn.execute(
+            "DELETE FROM semantic_cache WHERE id NOT IN "
+            "(SELECT id FROM semantic_cache ORDER BY id DESC LIMIT ?)",
+            (max_entries,),
+        )
+        self._conn.commit()
+
+        self._index: Dict[str, _EmbeddingIndex] = {}
+        self._count = 0
+        for namespace, blob, value, created_at in self._conn.execute(
+            "SELECT namespace, embedding, value, created_at FROM semantic_cache ORDER BY id"
+        ):
+            vec = _normalize(np.frombuffer(blob, dtype=np.float32))
+            self._append(namespace, vec, json.loads(value), created_at)
+
+    def _min_created_at(self) -> Optional[float]:
+        return time.time() - self.ttl if self.ttl is not None else None
+
+    def _append(self, namespace: str, vec: np.ndarray, value: Any, created_at: float) -> None:
+        index = self._index.get(namespace)
+        if index is None:
+            index = self._index[namespace] = _EmbeddingIndex(dim=vec.shape[0])
+        index.append(vec, value, created_at)
+        self._count += 1
+
+    def _evict(self) -> None:
+        """Drop expired rows and the oldest rows beyond ~90% of max_entries."""
+        keep = self.max_entries * 9 // 10
+        created = np.concatenate([index.created_at[: index.size] for index in self._index.values()])
+        if keep <= 0:
+            cutoff = float("inf")
+        elif keep < created.size:
+            cutoff = float(np.partition(created, -keep)[-keep])  # keep-th newest
+        else:
+            cutoff = float("-inf")
+        min_created_at = self._min_created_at()
+        if min_created_at is not None:
+            cutoff = max(cutoff, min_created_at)
+
+        for namespace in list(self._index):
+            index = self._index[namespace]
+            index.drop_before(cutoff)
+            if index.size == 0:
+                del self._index[namespace]
+        self._count = sum(index.size for index in self._index.values())
+        try:
+            self._conn.execute("DELETE FROM semantic_cache WHERE created_at < ?", (cutoff,))
+            self._conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def lookup(self, namespace: str, embedding: Sequence[float]) -> Optional[Any]:
+        """Return the value of the most similar unexpired entry, if it clears the threshold."""
+        q = _normalize(embedding)
+        with self._lock:
+            index = self._index.get(namespace)
+            if index is None or index.vectors.shape[1] != q.shape[0]:
+                return None
+            score, value = index.best_match(q, self._min_created_at())
+        if score < self.threshold:
+            return None
+        return value
+
+    def add(self, namespace: str, embedding: Sequence[float], value: Any) -> None:
+        """Store value under embedding. Value must be JSON-serializable."""
+        vec = _normalize(embedding)
+        created_at = time.time()
+        with self._lock:
+            self._append(namespace, vec, value, created_at)
+            try:
+                self._conn.execute(
+                    "INSERT INTO semantic_cache (namespace, embedding, value, created_at) VALUES (?, ?, ?, ?)",
+                    (namespace, vec.tobytes(), json.dumps(value), created_at),
+                )
+                self._conn.commit()
+            except sqlite3.Error:
+                pass  # Still served from memory for this process
+            if self._count > self.max_entries:
+                self._evict()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache: Optional[LLMCache] = None
+_default_semantic_cache: Optional[SemanticCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> Optional[LLMCache]:
+    """
+    Get the process-wide cache.
+
+    Location is read from LLM_CACHE_PATH (default: .cache/llm_cache.sqlite3).
+    Set LLM_CACHE_PATH to an empty string to disable caching.
+    """
+    global _default_cache
+
+    if _default_cache is not None:
+        return _default_cache
+
+    path = os.getenv("LLM_CACHE_PATH", DEFAULT_CACHE_PATH)
+    if not path:
+        return None
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            try:
+                _default_cache = LLMCache(path)
+            except (OSError, sqlite3.Error):
+                return None
+    return _default_cache
+
+
+def get_default_semantic_cache() -> Optional[SemanticCache]:
+    """
+    Get the process-wide semantic cache (same LLM_CACHE_PATH file as
+    get_default_cache). Returns None when caching is disabled.
+    """
+    global _default_semantic_cache
+
+    if _default_semantic_cache is not None:
+        return _default_semantic_cache
+
+    path = os.getenv("LLM_CACHE_PATH", DEFAULT_CACHE_PATH)
+    if not path:
+        return None
+
+    with _default_cache_lock:
+        if _default_semantic_cache is None:
+            try:
+                _default_semantic_cache = SemanticCache(path)
+            except (OSError, sqlite3.Error):
+                return None
+    return _default_semantic_cache
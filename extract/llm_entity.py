@@ -1,8 +1,18 @@
 from __future__ import annotations
 
-from typing import Optional
+import re
+from typing import List, Optional
 from openai import OpenAI
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+
+from extract.llm_cache import (
+    SemanticCache,
+    get_default_cache,
+    get_default_semantic_cache,
+    make_cache_key,
+)
+
+EMBEDDING_MODEL = "text-embedding-3-small"
 
 
 class CompanyEntity(BaseModel):
@@ -27,12 +37,35 @@ class CompanyEntity(BaseModel):
     )
 
 
+def _embed_question(client: OpenAI, question: str) -> Optional[List[float]]:
+    try:
+        resp = client.embeddings.create(model=EMBEDDING_MODEL, input=question)
+        return resp.data[0].embedding
+    except Exception:
+        return None
+
+
+def _mentions_entity(question: str, entity: CompanyEntity) -> bool:
+    """
+    Guard for semantic cache hits: paraphrases about different companies
+    ("How did NVIDIA do?" / "How did AMD do?") embed very closely, so only
+    accept a hit whose company name or ticker appears in the question as a
+    whole word ("Meta" must not match "metaverse", nor "AMD" "demand").
+    """
+    return any(
+        term and re.search(rf"(?<![a-z0-9]){re.escape(term.lower())}(?![a-z0-9])", question.lower())
+        for term in (entity.company_name, entity.ticker)
+    )
+
+
 def extract_company_from_question(
     *,
     client: OpenAI,
     question: str,
     model: str = "gpt-4o-mini",
     temperature: float = 0.1,
+    use_cache: bool = True,
+    semantic_cache: Optional[SemanticCache] = None,
 ) -> CompanyEntity:
     """
     Extract company entity from a user's question using LLM.
@@ -42,6 +75,9 @@ def extract_company_from_question(
         question: User's question text
         model: LLM model to use (default: gpt-4o-mini)
         temperature: Sampling temperature (default: 0.1 for deterministic)
+        use_cache: Serve repeated questions from the LLM cache (default: True)
+        semantic_cache: Optional embedding cache that also serves paraphrased
+            questions (costs one embeddings call on exact-cache misses)
 
     Returns:
         CompanyEntity with extracted company information
@@ -55,6 +91,34 @@ def extract_company_from_question(
         >>> print(entity.company_name)  # "NVIDIA"
         >>> print(entity.ticker)  # "NVDA"
     """
+    cache = get_default_cache() if use_cache else None
+    cache_key = make_cache_key(
+        "extract_company",
+        model=model,
+        question=question,
+        temperature=temperature,
+    )
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            try:
+                return CompanyEntity.model_validate(cached)
+            except ValidationError:
+                pass  # Stale shape; fall through and refresh the entry
+
+    semantic_namespace = f"extract_company:{model}:{EMBEDDING_MODEL}"
+    embedding = _embed_question(client, question) if semantic_cache is not None else None
+    if embedding is not None:
+        cached = semantic_cache.lookup(semantic_namespace, embedding)
+        if cached is not None:
+            try:
+                entity = CompanyEntity.model_validate(cached)
+            except ValidationError:
+                entity = None
+            if entity is not None and _mentions_entity(question, entity):
+                if cache is not None:
+                    cache.set(cache_key, entity.model_dump(mode="json"))
+                return entity
 
     prompt = f"""
 Extract the company entity from the following user question.
@@ -93,6 +157,11 @@ Examples:
         )
 
         entity: CompanyEntity = resp.output_parsed
+        if cache is not None:
+            cache.set(cache_key, entity.model_dump(mode="json"))
+        # Only index positive extractions; "no company" answers don't generalize
+        if embedding is not None and entity.company_name:
+            semantic_cache.add(semantic_namespace, embedding, entity.model_dump(mode="json"))
         return entity
 
     except Exception as e:
@@ -105,18 +174,20 @@ Examples:
         )
 
 
-def find_company_name_for_graph(
+def find_company_for_graph(
     *,
     client: OpenAI,
     question: str,
     model: str = "gpt-4o-mini",
     confidence_threshold: float = 0.5,
-) -> Optional[str]:
+) -> Optional[CompanyEntity]:
     """
-    Extract and return the company name suitable for graph lookup.
+    Extract the company entity suitable for graph lookup.
 
     This is a convenience wrapper around extract_company_from_question
-    that returns only the company name if confidence is above threshold.
+    that returns the entity (name and ticker) if confidence is above threshold.
+    Paraphrases of previously seen questions are resolved from the
+    semantic cache without an LLM call.
 
     Args:
         client: OpenAI client instance
@@ -125,24 +196,27 @@ def find_company_name_for_graph(
         confidence_threshold: Minimum confidence required (default: 0.5)
 
     Returns:
-        Company name if found with sufficient confidence, else None
+        CompanyEntity with a company_name or ticker if found with sufficient
+        confidence, else None
 
     Example:
         >>> client = OpenAI()
-        >>> name = find_company_name_for_graph(
+        >>> entity = find_company_for_graph(
         ...     client=client,
         ...     question="How did Tesla perform?"
         ... )
-        >>> print(name)  # "Tesla"
+        >>> print(entity.company_name, entity.ticker)  # "Tesla" "TSLA"
     """
     entity = extract_company_from_question(
         client=client,
         question=question,
-        model=model
+        model=model,
+        semantic_cache=get_default_semantic_cache(),
     )
 
-    # Return company name only if confidence meets threshold
-    if entity.confidence >= confidence_threshold and entity.company_name:
-        return entity.company_name
+    # Return the entity only if confidence meets threshold; the ticker alone
+    # is enough for the graph lookup to match on
+    if entity.confidence >= confidence_threshold and (entity.company_name or entity.ticker):
+        return entity
 
     return None
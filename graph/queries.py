@@ -19,6 +19,27 @@ def find_company_by_name(driver: Driver, name: str) -> Optional[Dict[str, Any]]:
         return rec["company"] if rec else None
 
 
+def find_company_by_name_or_ticker(
+    driver: Driver,
+    name: Optional[str],
+    ticker: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Find a company whose name or ticker matches (case-insensitive), in one
+    round-trip. A name match is preferred over a ticker match.
+    """
+    cypher = """
+    MATCH (c:Company)
+    WHERE toLower(c.name) = toLower($name) OR toLower(c.ticker) = toLower($ticker)
+    RETURN c { .id, .name, .ticker, .last_updated_at } AS company
+    ORDER BY CASE WHEN toLower(c.name) = toLower($name) THEN 0 ELSE 1 END
+    LIMIT 1
+    """
+    with driver.session() as session:
+        rec = session.run(cypher, name=name, ticker=ticker).single()
+        return rec["company"] if rec else None
+
+
 def get_event(driver: Driver, company_id: str, period: str, event_type: str = "earnings") -> Optional[Dict[str, Any]]:
     cypher = """
     MATCH (c:Company {id: $company_id})-[:HAS_EVENT]->(e:Event)
@@ -159,4 +180,33 @@ def get_latest_fetch_by_type(driver: Driver, company_id: str, period: str) -> Li
     """
     with driver.session() as session:
         rows = session.run(cypher, company_id=company_id, period=period)
-        return [{"source_type": r["source_type"], "last_fetched": r["last_fetched"]} for r in rows]
\ No newline at end of file
+        return [{"source_type": r["source_type"], "last_fetched": r["last_fetched"]} for r in rows]
+
+
+def get_latest_fetches_for_periods(
+    driver: Driver,
+    company_id: str,
+    periods: List[str],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    get_latest_fetch_by_type for several periods in a single query.
+
+    Returns:
+        Dictionary mapping period -> latest fetch rows (every requested
+        period is present, possibly with an empty list)
+    """
+    cypher = """
+    UNWIND $periods AS period
+    MATCH (c:Company {id: $company_id})-[:HAS_EVENT]->(e:Event {period: period})
+    MATCH (e)-[:HAS_CLAIM]->(cl:Claim)<-[:SUPPORTS]-(s:Source)
+    WITH period, s.source_type AS source_type, max(datetime(s.fetched_at)) AS last_fetched
+    RETURN period, source_type, toString(last_fetched) AS last_fetched
+    """
+    latest: Dict[str, List[Dict[str, Any]]] = {p: [] for p in periods}
+    with driver.session() as session:
+        rows = session.run(cypher, company_id=company_id, periods=list(latest))
+        for r in rows:
+            latest[r["period"]].append(
+                {"source_type": r["source_type"], "last_fetched": r["last_fetched"]}
+            )
+    return latest
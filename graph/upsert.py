@@ -77,53 +77,95 @@ def upsert_event(
         return rec["id"]
 
 
-def upsert_source(driver: Driver, doc: SourceDoc) -> str:
-    now = datetime.utcnow().isoformat()
-    published_at = doc.published_at.isoformat() if doc.published_at else None
-    fetched_at = doc.fetched_at.isoformat()
+# Upserts one Source per row of $rows (see _source_params); shared by the
+# single-doc and bulk paths so the property list lives in one place
+_SOURCE_MERGE_CYPHER = """
+    UNWIND $rows AS row
+    MERGE (s:Source {id: row.id})
+    ON CREATE SET s.url = row.url,
+                  s.title = row.title,
+                  s.source_type = row.source_type,
+                  s.site_name = row.site_name,
+                  s.author = row.author,
+                  s.language = row.language,
+                  s.query = row.search_query,
+                  s.published_at = row.published_at,
+                  s.fetched_at = row.fetched_at,
+                  s.created_at = row.now,
+                  s.last_updated_at = row.now
+    ON MATCH SET  s.title = coalesce(row.title, s.title),
+                  s.source_type = coalesce(row.source_type, s.source_type),
+                  s.site_name = coalesce(row.site_name, s.site_name),
+                  s.author = coalesce(row.author, s.author),
+                  s.language = coalesce(row.language, s.language),
+                  s.query = coalesce(row.search_query, s.query),
+                  s.published_at = coalesce(row.published_at, s.published_at),
+                  s.fetched_at = coalesce(row.fetched_at, s.fetched_at),
+                  s.last_updated_at = row.now
+"""
+
+
+def _source_params(doc: SourceDoc) -> Dict[str, Any]:
+    return {
+        "id": doc.source_id,
+        "url": doc.url,
+        "title": doc.title,
+        "source_type": doc.source_type,
+        "site_name": doc.site_name,
+        "author": doc.author,
+        "language": doc.language,
+        "search_query": doc.query,
+        "published_at": doc.published_at.isoformat() if doc.published_at else None,
+        "fetched_at": doc.fetched_at.isoformat(),
+        "now": datetime.utcnow().isoformat(),
+    }
 
-    cypher = """
-    MERGE (s:Source {id: $id})
-    ON CREATE SET s.url = $url,
-                  s.title = $title,
-                  s.source_type = $source_type,
-                  s.site_name = $site_name,
-                  s.author = $author,
-                  s.language = $language,
-                  s.query = $search_query,
-                  s.published_at = $published_at,
-                  s.fetched_at = $fetched_at,
-                  s.created_at = $now,
-                  s.last_updated_at = $now
-    ON MATCH SET  s.title = coalesce($title, s.title),
-                  s.source_type = coalesce($source_type, s.source_type),
-                  s.site_name = coalesce($site_name, s.site_name),
-                  s.author = coalesce($author, s.author),
-                  s.language = coalesce($language, s.language),
-                  s.query = coalesce($search_query, s.query),
-                  s.published_at = coalesce($published_at, s.published_at),
-                  s.fetched_at = coalesce($fetched_at, s.fetched_at),
-                  s.last_updated_at = $now
+
+def upsert_source(driver: Driver, doc: SourceDoc) -> str:
+    cypher = _SOURCE_MERGE_CYPHER + """
     RETURN s.id AS id
     """
     with driver.session() as session:
-        rec = session.run(
-            cypher,
-            id=doc.source_id,
-            url=doc.url,
-            title=doc.title,
-            source_type=doc.source_type,
-            site_name=doc.site_name,
-            author=doc.author,
-            language=doc.language,
-            search_query=doc.query,
-            published_at=published_at,
-            fetched_at=fetched_at,
-            now=now,
-        ).single()
+        rec = session.run(cypher, rows=[_source_params(doc)]).single()
         return rec["id"]
 
 
+def upsert_source_with_mention(driver: Driver, doc: SourceDoc, company_id: str) -> str:
+    """
+    Upsert a source and link it to the company it mentions in one round-trip.
+
+    Equivalent to upsert_source + link_source_mentions_company.
+    """
+    return upsert_sources_with_mentions_bulk(driver, [doc], company_id)[0]
+
+
+def upsert_sources_with_mentions_bulk(
+    driver: Driver,
+    docs: Iterable[SourceDoc],
+    company_id: str,
+) -> List[str]:
+    """
+    Batch version of upsert_source_with_mention: one UNWIND query for all docs.
+
+    Returns:
+        Source ids, in input order
+    """
+    rows = [_source_params(doc) for doc in docs]
+    if not rows:
+        return []
+
+    # The source is upserted either way; it is only linked when the company
+    # exists (same as the MATCH in link_source_mentions_company)
+    cypher = _SOURCE_MERGE_CYPHER + """
+    WITH s
+    MATCH (c:Company {id: $company_id})
+    MERGE (s)-[:MENTIONS]->(c)
+    """
+    with driver.session() as session:
+        session.run(cypher, rows=rows, company_id=company_id)
+    return [row["id"] for row in rows]
+
+
 def link_source_mentions_company(driver: Driver, source_id: str, company_id: str) -> None:
     cypher = """
     MATCH (s:Source {id: $source_id}), (c:Company {id: $company_id})
@@ -182,6 +224,62 @@ def upsert_claim(
         return rec["id"]
 
 
+def upsert_event_claims_bulk(
+    driver: Driver,
+    *,
+    company_id: str,
+    claims: Iterable[Dict[str, Any]],
+) -> List[str]:
+    """
+    Batch version of upsert_claim: one UNWIND query for many claims.
+
+    Each claim is a dict with event_id, source_id, text, claim_type and
+    confidence (the upsert_claim arguments). Ids match upsert_claim.
+
+    Returns:
+        Claim ids, in input order
+    """
+    now = datetime.utcnow().isoformat()
+    rows = [
+        {
+            "id": _id("claim", company_id, claim["event_id"], claim["text"].lower()),
+            "event_id": claim["event_id"],
+            "source_id": claim["source_id"],
+            "text": claim["text"],
+            "claim_type": claim["claim_type"],
+            "confidence": claim["confidence"],
+        }
+        for claim in claims
+    ]
+    if not rows:
+        return []
+
+    cypher = """
+    MATCH (c:Company {id: $company_id})
+    UNWIND $rows AS row
+    MATCH (e:Event {id: row.event_id})
+    MATCH (s:Source {id: row.source_id})
+
+    MERGE (cl:Claim {id: row.id})
+    ON CREATE SET cl.text = row.text,
+                  cl.claim_type = row.claim_type,
+                  cl.confidence = row.confidence,
+                  cl.created_at = $now,
+                  cl.last_updated_at = $now
+    ON MATCH SET  cl.text = row.text,
+                  cl.claim_type = row.claim_type,
+                  cl.confidence = row.confidence,
+                  cl.last_updated_at = $now
+
+    MERGE (e)-[:HAS_CLAIM]->(cl)
+    MERGE (s)-[:SUPPORTS]->(cl)
+    MERGE (cl)-[:ABOUT]->(c)
+    """
+    with driver.session() as session:
+        session.run(cypher, rows=rows, company_id=company_id, now=now)
+    return [row["id"] for row in rows]
+
+
 def upsert_signal(
     driver: Driver,
     company_id: str,
@@ -273,4 +371,121 @@ def upsert_claim_and_links(
     }
 
     with driver.session() as session:
-        session.run(cypher, params)
\ No newline at end of file
+        session.run(cypher, params)
+
+
+def upsert_claims_bulk(
+    driver: Driver,
+    *,
+    company_id: str,
+    source_id: str,
+    period: str,
+    claims: Iterable[Claim],
+) -> int:
+    """
+    Batch version of upsert_claim_and_links: one UNWIND query per source
+    instead of one query per claim.
+
+    Returns:
+        Number of claims written
+    """
+    rows = [
+        {
+            "claim_id": claim.claim_id,
+            "text": claim.text,
+            "claim_type": claim.claim_type,
+            "direction": claim.direction,
+            "timeframe": claim.timeframe,
+            "value": claim.value,
+            "unit": claim.unit,
+            "confidence": claim.confidence,
+            "evidence": claim.evidence,
+        }
+        for claim in claims
+    ]
+    if not rows:
+        return 0
+
+    cypher = """
+    UNWIND $claims AS row
+    MERGE (cl:Claim {id: row.claim_id})
+    SET cl.text = row.text,
+        cl.claim_type = row.claim_type,
+        cl.direction = row.direction,
+        cl.timeframe = row.timeframe,
+        cl.value = row.value,
+        cl.unit = row.unit,
+        cl.confidence = row.confidence,
+        cl.evidence = row.evidence
+
+    WITH cl
+    MATCH (c:Company {id: $company_id})
+    MATCH (s:Source {id: $source_id})
+
+    MERGE (c)-[:HAS_CLAIM {period: $period}]->(cl)
+    MERGE (s)-[:SUPPORTS]->(cl)
+    """
+
+    with driver.session() as session:
+        session.run(
+            cypher,
+            claims=rows,
+            company_id=company_id,
+            source_id=source_id,
+            period=period,
+        )
+    return len(rows)
+
+
+def upsert_signals_bulk(
+    driver: Driver,
+    *,
+    company_id: str,
+    signals: Iterable[Dict[str, Any]],
+    computed_at: Optional[datetime] = None,
+) -> List[str]:
+    """
+    Batch version of upsert_signal: one UNWIND query for many signals.
+
+    Each signal is a dict with event_id, signal_type, score, volume and
+    window. Ids match upsert_signal.
+
+    Returns:
+        Signal ids, in input order
+    """
+    computed_at_iso = (computed_at or datetime.utcnow()).isoformat()
+    rows = [
+        {
+            "id": _id("signal", company_id, sig["event_id"], sig["signal_type"], sig["window"]),
+            "event_id": sig["event_id"],
+            "signal_type": sig["signal_type"],
+            "score": sig["score"],
+            "volume": sig["volume"],
+            "window": sig["window"],
+        }
+        for sig in signals
+    ]
+    if not rows:
+        return []
+
+    cypher = """
+    MATCH (c:Company {id: $company_id})
+    UNWIND $rows AS row
+    MATCH (e:Event {id: row.event_id})
+
+    MERGE (sg:Signal {id: row.id})
+    ON CREATE SET sg.signal_type = row.signal_type,
+                  sg.score = row.score,
+                  sg.volume = row.volume,
+                  sg.window = row.window,
+                  sg.computed_at = $computed_at
+    ON MATCH SET  sg.score = row.score,
+                  sg.volume = row.volume,
+                  sg.computed_at = $computed_at
+
+    MERGE (sg)-[:ABOUT]->(c)
+    MERGE (sg)-[:IN_WINDOW]->(e)
+    """
+    with driver.session() as session:
+        session.run(cypher, rows=rows, company_id=company_id, computed_at=computed_at_iso)
+    return [row["id"] for row in rows]
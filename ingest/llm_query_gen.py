@@ -11,9 +11,13 @@ query generation using LLMs. Queries are optimized based on:
 
 from __future__ import annotations
 
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Mapping, Optional, List
 from openai import OpenAI
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+
+from extract.llm_cache import get_default_cache, make_cache_key
 
 
 class SearchQuery(BaseModel):
@@ -42,6 +46,71 @@ class SearchQuery(BaseModel):
     )
 
 
+# Event-specific guidance
+_EVENT_GUIDANCE: Mapping[str, str] = MappingProxyType({
+    "earnings": """
+Focus on: quarterly results, revenue, earnings per share (EPS), guidance,
+analyst reactions, beat/miss, outlook, growth metrics, key segments performance.
+""",
+    "product_launch": """
+Focus on: new product announcements, features, pricing, availability,
+market reception, competitive positioning, innovation, specifications.
+""",
+    "acquisition": """
+Focus on: M&A deals, acquisition terms, strategic rationale, integration plans,
+regulatory approval, deal value, market impact, synergies.
+""",
+    "regulatory": """
+Focus on: SEC filings, compliance updates, regulatory changes, government actions,
+legal proceedings, policy impacts, disclosure requirements.
+""",
+    "conference": """
+Focus on: earnings calls, investor presentations, conference keynotes, Q&A sessions,
+management commentary, strategic updates, analyst questions.
+""",
+})
+
+# Source-specific guidance
+_SOURCE_GUIDANCE: Mapping[str, str] = MappingProxyType({
+    "news": "Optimize for breaking news coverage, press releases, and journalist analysis.",
+    "blog": "Target in-depth analysis, expert commentary, and thought leadership.",
+    "forum": "Focus on community discussions, retail investor sentiment, and debates.",
+    "social": "Capture real-time reactions, trending topics, and viral content.",
+    "filing": "Target official documents, SEC filings, and regulatory disclosures.",
+})
+
+# Filled with str.format_map; only the placeholders below are substituted
+_PROMPT_TEMPLATE = """
+Generate an optimized search query to find information about a company event.
+
+Context:
+{context}
+
+Event Type Guidance:
+{event_guidance}
+
+Source Type Guidance:
+{source_guidance}
+
+Requirements:
+1. Create a primary query that will find the most relevant {source_type} content
+2. Include company name/ticker and period clearly
+3. Add event-specific keywords that journalists/analysts would use
+4. Keep queries concise (8-15 words optimal for search engines)
+5. Avoid overly generic terms; be specific to the event and timeframe
+6. Consider synonyms and alternative phrasings (for alternative_queries)
+7. Extract 5-10 key search terms/concepts (for keywords field)
+
+Examples of good queries:
+- For NVIDIA Q3-2025 earnings: "NVIDIA Q3 2025 earnings results revenue guidance AI data center"
+- For Tesla product launch: "Tesla 2025 new model launch specifications pricing availability"
+- For Microsoft acquisition: "Microsoft 2025 acquisition deal terms regulatory approval impact"
+
+Generate a search query that maximizes recall of relevant {source_type} content about
+{company_name}'s {event_type} for period {period}.
+"""
+
+
 def generate_search_query(
     *,
     client: OpenAI,
@@ -53,6 +122,7 @@ def generate_search_query(
     industry: Optional[str] = None,
     model: str = "gpt-4o-mini",
     temperature: float = 0.3,
+    use_cache: bool = True,
 ) -> SearchQuery:
     """
     Generate an intelligent search query for finding company event information.
@@ -77,6 +147,7 @@ def generate_search_query(
         industry: Industry/sector (optional, e.g., "semiconductors", "automotive")
         model: LLM model to use (default: "gpt-4o-mini")
         temperature: Sampling temperature (default: 0.3 for focused creativity)
+        use_cache: Serve repeated inputs from the LLM cache (default: True)
 
     Returns:
         SearchQuery with primary query, alternatives, keywords, and reasoning
@@ -94,6 +165,25 @@ def generate_search_query(
         >>> print(query.primary_query)
         "NVIDIA Q3 2025 earnings results revenue guidance AI data center growth"
     """
+    cache = get_default_cache() if use_cache else None
+    cache_key = make_cache_key(
+        "generate_search_query",
+        model=model,
+        company_name=company_name,
+        period=period,
+        event_type=event_type,
+        source_type=source_type,
+        ticker=ticker,
+        industry=industry,
+        temperature=temperature,
+    )
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            try:
+                return SearchQuery.model_validate(cached)
+            except ValidationError:
+                pass  # Stale shape; fall through and refresh the entry
 
     # Build context information
     context_parts = [f"Company: {company_name}"]
@@ -107,68 +197,15 @@ def generate_search_query(
 
     context = "\n".join(context_parts)
 
-    # Event-specific guidance
-    event_guidance = {
-        "earnings": """
-Focus on: quarterly results, revenue, earnings per share (EPS), guidance,
-analyst reactions, beat/miss, outlook, growth metrics, key segments performance.
-""",
-        "product_launch": """
-Focus on: new product announcements, features, pricing, availability,
-market reception, competitive positioning, innovation, specifications.
-""",
-        "acquisition": """
-Focus on: M&A deals, acquisition terms, strategic rationale, integration plans,
-regulatory approval, deal value, market impact, synergies.
-""",
-        "regulatory": """
-Focus on: SEC filings, compliance updates, regulatory changes, government actions,
-legal proceedings, policy impacts, disclosure requirements.
-""",
-        "conference": """
-Focus on: earnings calls, investor presentations, conference keynotes, Q&A sessions,
-management commentary, strategic updates, analyst questions.
-""",
-    }
-
-    # Source-specific guidance
-    source_guidance = {
-        "news": "Optimize for breaking news coverage, press releases, and journalist analysis.",
-        "blog": "Target in-depth analysis, expert commentary, and thought leadership.",
-        "forum": "Focus on community discussions, retail investor sentiment, and debates.",
-        "social": "Capture real-time reactions, trending topics, and viral content.",
-        "filing": "Target official documents, SEC filings, and regulatory disclosures.",
-    }
-
-    prompt = f"""
-Generate an optimized search query to find information about a company event.
-
-Context:
-{context}
-
-Event Type Guidance:
-{event_guidance.get(event_type, "General event coverage.")}
-
-Source Type Guidance:
-{source_guidance.get(source_type, "General web content.")}
-
-Requirements:
-1. Create a primary query that will find the most relevant {source_type} content
-2. Include company name/ticker and period clearly
-3. Add event-specific keywords that journalists/analysts would use
-4. Keep queries concise (8-15 words optimal for search engines)
-5. Avoid overly generic terms; be specific to the event and timeframe
-6. Consider synonyms and alternative phrasings (for alternative_queries)
-7. Extract 5-10 key search terms/concepts (for keywords field)
-
-Examples of good queries:
-- For NVIDIA Q3-2025 earnings: "NVIDIA Q3 2025 earnings results revenue guidance AI data center"
-- For Tesla product launch: "Tesla 2025 new model launch specifications pricing availability"
-- For Microsoft acquisition: "Microsoft 2025 acquisition deal terms regulatory approval impact"
-
-Generate a search query that maximizes recall of relevant {source_type} content about
-{company_name}'s {event_type} for period {period}.
-"""
+    prompt = _PROMPT_TEMPLATE.format_map({
+        "context": context,
+        "event_guidance": _EVENT_GUIDANCE.get(event_type, "General event coverage."),
+        "source_guidance": _SOURCE_GUIDANCE.get(source_type, "General web content."),
+        "source_type": source_type,
+        "company_name": company_name,
+        "event_type": event_type,
+        "period": period,
+    })
 
     try:
         resp = client.responses.parse(
@@ -186,23 +223,52 @@ Generate a search query that maximizes recall of relevant {source_type} content
         )
 
         query: SearchQuery = resp.output_parsed
+        if cache is not None:
+            cache.set(cache_key, query.model_dump(mode="json"))
         return query
 
     except Exception as e:
         # Fallback to basic query if LLM fails
-        fallback_query = _fallback_query(
+        return fallback_search_query(
             company_name=company_name,
             period=period,
             event_type=event_type,
-            ticker=ticker
+            ticker=ticker,
+            reasoning=f"Fallback query (LLM generation failed: {str(e)})",
         )
 
-        return SearchQuery(
-            primary_query=fallback_query,
-            alternative_queries=[],
-            keywords=[company_name, period, event_type],
-            reasoning=f"Fallback query (LLM generation failed: {str(e)})"
-        )
+
+# Event types whose template query is good enough to skip the LLM entirely
+FAST_PATH_EVENT_TYPES = frozenset({"earnings", "product_launch", "acquisition", "regulatory", "conference"})
+
+
+def fallback_search_query(
+    *,
+    company_name: str,
+    period: str,
+    event_type: str = "earnings",
+    ticker: Optional[str] = None,
+    reasoning: str = "Template query (LLM generation skipped)",
+) -> SearchQuery:
+    """
+    Build a SearchQuery from the deterministic template, without an LLM call.
+
+    Example:
+        >>> query = fallback_search_query(company_name="NVIDIA", period="Q3-2025", ticker="NVDA")
+        >>> print(query.primary_query)
+        "NVIDIA NVDA Q3-2025 earnings results revenue EPS guidance"
+    """
+    return SearchQuery(
+        primary_query=_fallback_query(
+            company_name=company_name,
+            period=period,
+            event_type=event_type,
+            ticker=ticker
+        ),
+        alternative_queries=[],
+        keywords=[company_name, period, event_type],
+        reasoning=reasoning,
+    )
 
 
 def _fallback_query(
@@ -272,17 +338,23 @@ def generate_multi_source_queries(
     """
     source_types = source_types or ["news"]
 
-    queries = {}
-    for source_type in source_types:
-        queries[source_type] = generate_search_query(
-            client=client,
-            company_name=company_name,
-            period=period,
-            event_type=event_type,
-            source_type=source_type,
-            ticker=ticker,
-            industry=industry,
-            model=model,
-        )
+    # Each source type is an independent LLM round-trip; issue them concurrently
+    with ThreadPoolExecutor(max_workers=len(source_types)) as executor:
+        futures = {
+            source_type: executor.submit(
+                generate_search_query,
+                client=client,
+                company_name=company_name,
+                period=period,
+                event_type=event_type,
+                source_type=source_type,
+                ticker=ticker,
+                industry=industry,
+                model=model,
+            )
+            for source_type in source_types
+        }
+        # Preserve the caller's source_types order in the result
+        queries = {source_type: future.result() for source_type, future in futures.items()}
 
     return queries
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import os
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 import logging
@@ -11,19 +13,25 @@ from neo4j import Driver
 from extract.contracts import SourceDoc
 from extract.llm_claims import extract_claims_from_source_openai
 
-from graph.upsert import upsert_source, link_source_mentions_company
+from graph.upsert import upsert_source_with_mention, upsert_claims_bulk
 
-from ingest.brightdata import google_serp_urls, unlock_to_markdown
-from ingest.llm_query_gen import generate_search_query
-
-from graph.upsert import upsert_claim_and_links
+from ingest.brightdata import SerpResult, google_serp_urls, unlock_to_markdown
+from ingest.llm_query_gen import FAST_PATH_EVENT_TYPES, fallback_search_query, generate_search_query
 
 
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
-def refresh_company_period(
+# Max number of SERP results fetched/extracted concurrently
+MAX_CONCURRENT_FETCHES = 5
+
+# Stop waiting on slower URLs once this many sources have been ingested
+TARGET_DOCS = 3
+
+
+async def refresh_company_period(
     driver: Driver,
+    llm_client: OpenAI,
     company_id: str,
     company_name: str,
     period: str,
@@ -31,12 +39,14 @@ def refresh_company_period(
     event_type: str = "earnings",
     ticker: Optional[str] = None,
     industry: Optional[str] = None,
+    target_docs: Optional[int] = TARGET_DOCS,
 ) -> Dict:
     """
     Refresh company data for a specific period by discovering and ingesting sources.
 
     Args:
         driver: Neo4j driver
+        llm_client: Shared OpenAI client (reused across refreshes for connection pooling)
         company_id: Company ID in graph
         company_name: Company name (e.g., "NVIDIA")
         period: Period identifier (e.g., "Q3-2025")
@@ -44,83 +54,114 @@ def refresh_company_period(
         event_type: Type of event (default: "earnings")
         ticker: Stock ticker symbol (optional)
         industry: Industry/sector (optional)
+        target_docs: Cancel the remaining URL pipelines once this many sources
+            have been upserted, trading recall for tail latency (None = wait for all).
+            Cancellation only stops pipelines between steps: a fetch, claim
+            extraction or upsert already running in a worker thread finishes
+            (and may still write to the graph) after this function returns.
 
     Returns:
         Dictionary with refresh statistics
     """
-    llm_client = OpenAI()
     source_types = source_types or ["news"]
 
-    # 1) Generate intelligent search query using LLM
-    query_obj = generate_search_query(
-        client=llm_client,
-        company_name=company_name,
-        period=period,
-        event_type=event_type,
-        source_type=source_types[0],  # Use first source type for query generation
-        ticker=ticker,
-        industry=industry,
-    )
+    # 1) Build the search query. Known event types use the template query;
+    # the LLM is only worth its round-trip for novel types or extra context.
+    use_llm = os.getenv("USE_LLM_QUERIES", "").lower() in ("1", "true", "yes")
+    if not use_llm and event_type in FAST_PATH_EVENT_TYPES and not industry:
+        query_obj = fallback_search_query(
+            company_name=company_name,
+            period=period,
+            event_type=event_type,
+            ticker=ticker,
+        )
+    else:
+        query_obj = await asyncio.to_thread(
+            generate_search_query,
+            client=llm_client,
+            company_name=company_name,
+            period=period,
+            event_type=event_type,
+            source_type=source_types[0],  # Use first source type for query generation
+            ticker=ticker,
+            industry=industry,
+        )
 
     serp_query = query_obj.primary_query
     log.info("Generated search query: %s", serp_query)
     log.info("Query reasoning: %s", query_obj.reasoning)
 
     # 2) Discover URLs via SERP (use Google News vertical to bias toward coverage)
-    serp_results = google_serp_urls(serp_query, max_results=5, tbm="nws")
+    serp_results = await asyncio.to_thread(google_serp_urls, serp_query, max_results=5, tbm="nws")
 
-    # 3) Fetch pages via Unlocker (markdown), normalize to SourceDoc, upsert
+    # 3) Fetch pages via Unlocker (markdown), normalize to SourceDoc, upsert.
+    # Each URL is an independent, network-bound pipeline, so run them concurrently.
     upserted = 0
     docs: List[SourceDoc] = []
     errors: List[Dict] = []
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+    async def _process_url(r: SerpResult) -> None:
+        nonlocal upserted
+        async with semaphore:
+            try:
+                md = await asyncio.to_thread(unlock_to_markdown, r.url, country="us")
+                if not md:
+                    return
+                doc = SourceDoc(
+                    url=r.url,
+                    title=r.title or r.url,
+                    raw_text=md,
+                    source_type="news",
+                    fetched_at=datetime.now(timezone.utc),
+                    query=serp_query,
+                    site_name=None,
+                    metadata={
+                        "serp_title": r.title,
+                        "serp_description": r.description,
+                        "serp_rank": r.rank,
+                    },
+                )
+                docs.append(doc)
+                log.info("Fetched source %s (%d chars)", doc.url, len(doc.raw_text))
+                source_id = await asyncio.to_thread(upsert_source_with_mention, driver, doc, company_id)
+
+                # 4) Extract claims using OpenAI + upsert into graph
+                claims = await asyncio.to_thread(
+                    extract_claims_from_source_openai,
+                    client=llm_client,
+                    company_name=company_name,
+                    period=period,
+                    source=doc,
+                )
 
-    for r in serp_results:
-        try:
-            md = unlock_to_markdown(r.url, country="us")
-            if not md:
-                continue
-            doc = SourceDoc(
-                url=r.url,
-                title=r.title or r.url,
-                raw_text=md,
-                source_type="news",
-                fetched_at=datetime.now(timezone.utc),
-                query=serp_query,
-                site_name=None,
-                metadata={
-                    "serp_title": r.title,
-                    "serp_description": r.description,
-                    "serp_rank": r.rank,
-                },
-            )
-            docs.append(doc)
-            log.info("Fetched source %s (%d chars)", doc.url, len(doc.raw_text))
-            source_id = upsert_source(driver, doc)
-
-            # 4) Extract claims using OpenAI + upsert into graph
-            claims = extract_claims_from_source_openai(
-                client=llm_client,
-                company_name=company_name,
-                period=period,
-                source=doc,
-            )
-
-            for claim in claims:
-                upsert_claim_and_links(
+                await asyncio.to_thread(
+                    upsert_claims_bulk,
                     driver,
                     company_id=company_id,
                     source_id=source_id,
                     period=period,
-                    claim=claim,
+                    claims=claims,
                 )
-
-            link_source_mentions_company(driver, source_id, company_id)
-            upserted += 1
-
-        except Exception as e:
-            errors.append({"url": r.url, "error": str(e)})
-            raise e
-            
+                upserted += 1
+
+            except Exception as e:
+                # One bad URL shouldn't discard the work done for the others
+                log.exception("fetch failed for %s", r.url)
+                errors.append({"url": r.url, "error": str(e)})
+
+    tasks = [asyncio.create_task(_process_url(r)) for r in serp_results]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            await next_done
+            if target_docs is not None and upserted >= target_docs:
+                break
+    finally:
+        # Pipelines waiting on the semaphore or between steps stop here; a
+        # blocking call already running in its thread cannot be interrupted
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     return {
         "company": company_name,
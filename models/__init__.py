@@ -5,6 +5,8 @@ from .registry import (
     SignalType,
     EventTypeMetadata,
     SignalTypeMetadata,
+    EventTypeInfo,
+    SignalTypeInfo,
     EVENT_REGISTRY,
     SIGNAL_REGISTRY,
     get_event_types,
@@ -25,6 +27,8 @@ __all__ = [
     "SignalType",
     "EventTypeMetadata",
     "SignalTypeMetadata",
+    "EventTypeInfo",
+    "SignalTypeInfo",
     "EVENT_REGISTRY",
     "SIGNAL_REGISTRY",
     "get_event_types",
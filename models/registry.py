@@ -8,8 +8,9 @@ and signal types, replacing hardcoded "earnings" and "sentiment" values.
 from __future__ import annotations
 
 from enum import Enum
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 
 class EventType(str, Enum):
@@ -48,33 +49,137 @@ class SignalType(str, Enum):
     INSTITUTIONAL_FLOW = "institutional_flow"
 
 
-@dataclass
-class EventTypeMetadata:
-    """Metadata describing an event type."""
+class _FrozenMetadata:
+    """
+    Immutable slotted record. Subclasses fill their slots once in __init__
+    through the slot descriptors (normal assignment raises), and are
+    compared, hashed and shown by _FIELDS.
+    """
 
-    event_type: EventType
-    display_name: str
-    description: str
-    typical_frequency: str  # e.g., "quarterly", "annual", "ad-hoc"
-    default_window: str = "post_event_7d"
-    requires_date: bool = True
+    __slots__ = ()
+    _FIELDS: tuple[str, ...] = ()
 
+    def _values(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self._FIELDS)
 
-@dataclass
-class SignalTypeMetadata:
-    """Metadata describing a signal type."""
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable; cannot set {name!r}")
 
-    signal_type: SignalType
-    display_name: str
-    description: str
-    unit: str  # e.g., "score", "percentage", "rating"
-    min_value: Optional[float] = None
-    max_value: Optional[float] = None
-    higher_is_better: Optional[bool] = None
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable; cannot delete {name!r}")
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._values() == other._values()
 
+    def __hash__(self) -> int:
+        return hash(self._values())
 
-# Event Type Registry
-EVENT_REGISTRY: Dict[EventType, EventTypeMetadata] = {
+    def __repr__(self) -> str:
+        args = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._FIELDS)
+        return f"{type(self).__name__}({args})"
+
+
+class EventTypeMetadata(_FrozenMetadata):
+    """Metadata describing an event type."""
+
+    __slots__ = _FIELDS = (
+        "event_type",
+        "display_name",
+        "description",
+        "typical_frequency",
+        "default_window",
+        "requires_date",
+    )
+
+    def __init__(
+        self,
+        event_type: EventType,
+        display_name: str,
+        description: str,
+        typical_frequency: str,  # e.g., "quarterly", "annual", "ad-hoc"
+        default_window: str = "post_event_7d",
+        requires_date: bool = True,
+    ):
+        _set_event_type(self, event_type)
+        _set_event_display_name(self, display_name)
+        _set_event_description(self, description)
+        _set_event_typical_frequency(self, typical_frequency)
+        _set_event_default_window(self, default_window)
+        _set_event_requires_date(self, requires_date)
+
+
+# Slot setters bound once; calling the descriptors directly is much cheaper
+# than going through object.__setattr__ for every field
+(
+    _set_event_type,
+    _set_event_display_name,
+    _set_event_description,
+    _set_event_typical_frequency,
+    _set_event_default_window,
+    _set_event_requires_date,
+) = (EventTypeMetadata.__dict__[name].__set__ for name in EventTypeMetadata.__slots__)
+
+
+class SignalTypeMetadata(_FrozenMetadata):
+    """Metadata describing a signal type."""
+
+    _FIELDS = (
+        "signal_type",
+        "display_name",
+        "description",
+        "unit",
+        "min_value",
+        "max_value",
+        "higher_is_better",
+    )
+    # range_str is derived from min/max, so it is not part of _FIELDS
+    __slots__ = _FIELDS + ("range_str",)
+
+    def __init__(
+        self,
+        signal_type: SignalType,
+        display_name: str,
+        description: str,
+        unit: str,  # e.g., "score", "percentage", "rating"
+        min_value: float | None = None,
+        max_value: float | None = None,
+        higher_is_better: bool | None = None,
+    ):
+        _set_signal_type(self, signal_type)
+        _set_signal_display_name(self, display_name)
+        _set_signal_description(self, description)
+        _set_signal_unit(self, unit)
+        _set_signal_min_value(self, min_value)
+        _set_signal_max_value(self, max_value)
+        _set_signal_higher_is_better(self, higher_is_better)
+
+        # Human-readable value range, formatted once for the API listing
+        if min_value is None and max_value is None:
+            _set_signal_range_str(self, "unlimited")
+        elif max_value is None:
+            _set_signal_range_str(self, f"{min_value} to ∞")
+        elif min_value is None:
+            _set_signal_range_str(self, f"-∞ to {max_value}")
+        else:
+            _set_signal_range_str(self, f"{min_value} to {max_value}")
+
+
+(
+    _set_signal_type,
+    _set_signal_display_name,
+    _set_signal_description,
+    _set_signal_unit,
+    _set_signal_min_value,
+    _set_signal_max_value,
+    _set_signal_higher_is_better,
+    _set_signal_range_str,
+) = (SignalTypeMetadata.__dict__[name].__set__ for name in SignalTypeMetadata.__slots__)
+
+
+# Event Type Registry (read-only; the lookup tables below are derived from it)
+EVENT_REGISTRY: Mapping[EventType, EventTypeMetadata] = MappingProxyType({
     EventType.EARNINGS: EventTypeMetadata(
         event_type=EventType.EARNINGS,
         display_name="Earnings Report",
@@ -155,11 +260,11 @@ EVENT_REGISTRY: Dict[EventType, EventTypeMetadata] = {
         default_window="post_event_14d",
         requires_date=True,
     ),
-}
+})
 
 
-# Signal Type Registry
-SIGNAL_REGISTRY: Dict[SignalType, SignalTypeMetadata] = {
+# Signal Type Registry (read-only)
+SIGNAL_REGISTRY: Mapping[SignalType, SignalTypeMetadata] = MappingProxyType({
     SignalType.SENTIMENT: SignalTypeMetadata(
         signal_type=SignalType.SENTIMENT,
         display_name="Sentiment Score",
@@ -232,102 +337,138 @@ SIGNAL_REGISTRY: Dict[SignalType, SignalTypeMetadata] = {
         max_value=1.0,
         higher_is_better=True,
     ),
-}
+})
 
 
 # Helper Functions
 
-def get_event_types() -> List[EventType]:
-    """Get list of all registered event types."""
-    return list(EVENT_REGISTRY.keys())
+_EVENT_TYPES: tuple[EventType, ...] = tuple(EVENT_REGISTRY)
+_SIGNAL_TYPES: tuple[SignalType, ...] = tuple(SIGNAL_REGISTRY)
+
 
+def get_event_types() -> tuple[EventType, ...]:
+    """Get all registered event types (shared, immutable)."""
+    return _EVENT_TYPES
 
-def get_signal_types() -> List[SignalType]:
-    """Get list of all registered signal types."""
-    return list(SIGNAL_REGISTRY.keys())
 
+def get_signal_types() -> tuple[SignalType, ...]:
+    """Get all registered signal types (shared, immutable)."""
+    return _SIGNAL_TYPES
 
-def get_event_metadata(event_type: EventType) -> Optional[EventTypeMetadata]:
-    """Get metadata for a specific event type."""
-    return EVENT_REGISTRY.get(event_type)
 
+# The registries are static, so metadata lookups are the bound dict .get
+# itself (no extra Python call frame). Both return None for unknown types.
+get_event_metadata: Callable[[EventType], EventTypeMetadata | None] = EVENT_REGISTRY.get
+get_signal_metadata: Callable[[SignalType], SignalTypeMetadata | None] = SIGNAL_REGISTRY.get
 
-def get_signal_metadata(signal_type: SignalType) -> Optional[SignalTypeMetadata]:
-    """Get metadata for a specific signal type."""
-    return SIGNAL_REGISTRY.get(signal_type)
+
+_EVENT_VALUES: frozenset[str] = frozenset(e.value for e in EventType)
+_SIGNAL_VALUES: frozenset[str] = frozenset(s.value for s in SignalType)
 
 
 def validate_event_type(event_type: str) -> bool:
     """Check if an event type string is valid."""
-    try:
-        EventType(event_type)
-        return True
-    except ValueError:
-        return False
+    # Plain set membership; avoids Enum.__call__ and raising ValueError
+    return event_type in _EVENT_VALUES
 
 
 def validate_signal_type(signal_type: str) -> bool:
     """Check if a signal type string is valid."""
-    try:
-        SignalType(signal_type)
-        return True
-    except ValueError:
-        return False
+    return signal_type in _SIGNAL_VALUES
+
+
+_EVENT_DEFAULT_WINDOWS: dict[EventType, str] = {
+    et: meta.default_window for et, meta in EVENT_REGISTRY.items()
+}
+_EVENT_DISPLAY_NAMES: dict[EventType, str] = {
+    et: meta.display_name for et, meta in EVENT_REGISTRY.items()
+}
+_SIGNAL_DISPLAY_NAMES: dict[SignalType, str] = {
+    st: meta.display_name for st, meta in SIGNAL_REGISTRY.items()
+}
 
 
 def get_default_window(event_type: EventType) -> str:
     """Get the default window for an event type."""
-    metadata = get_event_metadata(event_type)
-    return metadata.default_window if metadata else "post_event_7d"
+    return _EVENT_DEFAULT_WINDOWS.get(event_type, "post_event_7d")
 
 
 def get_event_type_display_name(event_type: EventType) -> str:
     """Get human-readable display name for event type."""
-    metadata = get_event_metadata(event_type)
-    return metadata.display_name if metadata else event_type.value
+    # `or` keeps .value lazy, so registered plain strings work too
+    return _EVENT_DISPLAY_NAMES.get(event_type) or event_type.value
 
 
 def get_signal_type_display_name(signal_type: SignalType) -> str:
     """Get human-readable display name for signal type."""
-    metadata = get_signal_metadata(signal_type)
-    return metadata.display_name if metadata else signal_type.value
+    return _SIGNAL_DISPLAY_NAMES.get(signal_type) or signal_type.value
+
+
+class EventTypeInfo(NamedTuple):
+    """API view of an event type (use ._asdict() for a plain dict)."""
+
+    type: str
+    display_name: str
+    description: str
+    frequency: str
+    default_window: str
+
 
+class SignalTypeInfo(NamedTuple):
+    """API view of a signal type (use ._asdict() for a plain dict)."""
 
-def list_event_types_info() -> List[Dict[str, str]]:
+    type: str
+    display_name: str
+    description: str
+    unit: str
+    range: str
+
+
+# Static views of the registries, built once at import
+_EVENT_TYPES_INFO: tuple[EventTypeInfo, ...] = tuple(
+    EventTypeInfo(
+        type=meta.event_type.value,
+        display_name=meta.display_name,
+        description=meta.description,
+        frequency=meta.typical_frequency,
+        default_window=meta.default_window,
+    )
+    for meta in EVENT_REGISTRY.values()
+)
+
+_SIGNAL_TYPES_INFO: tuple[SignalTypeInfo, ...] = tuple(
+    SignalTypeInfo(
+        type=meta.signal_type.value,
+        display_name=meta.display_name,
+        description=meta.description,
+        unit=meta.unit,
+        range=meta.range_str,
+    )
+    for meta in SIGNAL_REGISTRY.values()
+)
+
+
+def list_event_types_info() -> tuple[EventTypeInfo, ...]:
     """
-    Get a list of all event types with their metadata.
+    Get all event types with their metadata.
+
+    The registry is static, so the result is built once at import and
+    shared between callers.
 
     Returns:
-        List of dicts with event type information
+        Tuple of EventTypeInfo records
     """
-    return [
-        {
-            "type": et.value,
-            "display_name": meta.display_name,
-            "description": meta.description,
-            "frequency": meta.typical_frequency,
-            "default_window": meta.default_window,
-        }
-        for et, meta in EVENT_REGISTRY.items()
-    ]
-
-
-def list_signal_types_info() -> List[Dict[str, str]]:
+    return _EVENT_TYPES_INFO
+
+
+def list_signal_types_info() -> tuple[SignalTypeInfo, ...]:
     """
-    Get a list of all signal types with their metadata.
+    Get all signal types with their metadata.
+
+    The registry is static, so the result is built once at import and
+    shared between callers.
 
     Returns:
-        List of dicts with signal type information
+        Tuple of SignalTypeInfo records
     """
-    return [
-        {
-            "type": st.value,
-            "display_name": meta.display_name,
-            "description": meta.description,
-            "unit": meta.unit,
-            "range": f"{meta.min_value} to {meta.max_value}"
-            if meta.min_value is not None
-            else "unlimited",
-        }
-        for st, meta in SIGNAL_REGISTRY.items()
-    ]
+    return _SIGNAL_TYPES_INFO
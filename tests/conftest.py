@@ -0,0 +1,28 @@
+"""
+Shared pytest setup for the PulseGraph tests.
+
+Puts the project root on sys.path once for every test module, and provides
+an OpenAI client fixture so the client (and the openai import) is only
+created for tests that actually call the API.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """OpenAI client shared by the LLM tests; skips them when no API key is set."""
+    if not os.getenv("OPENAI_API_KEY"):
+        pytest.skip("OPENAI_API_KEY not set")
+
+    from openai import OpenAI
+
+    return OpenAI()
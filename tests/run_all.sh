@@ -11,7 +11,7 @@ cd "$(dirname "$0")/.."
 
 echo "🧪 Test 1: Period Calculation Utilities"
 echo "------------------------------------------"
-python3 tests/test_periods.py
+python3 -m tests.test_periods
 PERIODS_EXIT=$?
 echo ""
 
@@ -22,7 +22,7 @@ if [ -z "$OPENAI_API_KEY" ]; then
     echo "   Set your OpenAI API key in .env or export OPENAI_API_KEY to run this test."
     ENTITY_EXIT=0
 else
-    python3 tests/test_entity_extraction.py 2>&1
+    python3 -m tests.test_entity_extraction 2>&1
     ENTITY_EXIT=$?
     # If exit code is 1 and output contains "ModuleNotFoundError", treat as skipped
     if [ $ENTITY_EXIT -ne 0 ]; then
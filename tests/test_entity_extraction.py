@@ -2,28 +2,18 @@
 """
 Quick test script for LLM-based company entity extraction.
 
-Usage:
-    python3 tests/test_entity_extraction.py
-
-    Or from project root:
+Usage (from project root):
     python3 -m tests.test_entity_extraction
-"""
-
-import sys
-from pathlib import Path
-
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
-from openai import OpenAI
-from extract.llm_entity import extract_company_from_question, find_company_name_for_graph
+    Or with pytest (skipped without OPENAI_API_KEY):
+    python3 -m pytest tests/test_entity_extraction.py
+"""
 
 
-def test_entity_extraction():
+def test_entity_extraction(client):
     """Test various question formats for company extraction."""
-
-    client = OpenAI()
+    # Imported here so collecting this module doesn't load the OpenAI SDK
+    from extract.llm_entity import extract_company_from_question, find_company_for_graph
 
     test_cases = [
         # Clear mentions
@@ -61,12 +51,17 @@ def test_entity_extraction():
         print(f"  Reasoning: {entity.reasoning}")
 
         # Test graph lookup convenience function
-        graph_name = find_company_name_for_graph(client=client, question=question)
-        print(f"  → Graph lookup: {graph_name or 'None (below threshold)'}")
+        graph_entity = find_company_for_graph(client=client, question=question)
+        if graph_entity:
+            print(f"  → Graph lookup: {graph_entity.company_name or '-'} / {graph_entity.ticker or '-'}")
+        else:
+            print("  → Graph lookup: None (below threshold)")
         print()
 
     print("=" * 80)
 
 
 if __name__ == "__main__":
-    test_entity_extraction()
+    from openai import OpenAI
+
+    test_entity_extraction(OpenAI())
@@ -2,27 +2,22 @@
 """
 Test script for event and signal type registry.
 
-Usage:
-    python3 tests/test_event_signal_registry.py
-
-    Or from project root:
+Usage (from project root):
     python3 -m tests.test_event_signal_registry
+
+    Or with pytest:
+    python3 -m pytest tests/test_event_signal_registry.py
 """
 
 import sys
-from pathlib import Path
-
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 from models.registry import (
+    EVENT_REGISTRY,
+    SIGNAL_REGISTRY,
     EventType,
     SignalType,
     get_event_types,
     get_signal_types,
-    get_event_metadata,
-    get_signal_metadata,
     validate_event_type,
     validate_signal_type,
     get_default_window,
@@ -33,190 +28,200 @@ from models.registry import (
 
 def test_event_types():
     """Test event type registry."""
-    print("=" * 80)
-    print("Testing Event Type Registry")
-    print("=" * 80)
-    print()
+    lines = []
+    lines.append("=" * 80)
+    lines.append("Testing Event Type Registry")
+    lines.append("=" * 80)
+    lines.append("")
 
-    event_types = get_event_types()
-    print(f"Total Event Types: {len(event_types)}")
-    print()
+    lines.append(f"Total Event Types: {len(get_event_types())}")
+    lines.append("")
 
-    for event_type in event_types:
-        metadata = get_event_metadata(event_type)
-        print(f"✓ {metadata.display_name} ({event_type.value})")
-        print(f"  Description: {metadata.description}")
-        print(f"  Frequency: {metadata.typical_frequency}")
-        print(f"  Default Window: {metadata.default_window}")
-        print(f"  Requires Date: {metadata.requires_date}")
-        print()
+    for event_type, metadata in EVENT_REGISTRY.items():
+        lines.append(f"✓ {metadata.display_name} ({event_type.value})")
+        lines.append(f"  Description: {metadata.description}")
+        lines.append(f"  Frequency: {metadata.typical_frequency}")
+        lines.append(f"  Default Window: {metadata.default_window}")
+        lines.append(f"  Requires Date: {metadata.requires_date}")
+        lines.append("")
 
-    print("=" * 80)
-    print()
+    lines.append("=" * 80)
+    lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def test_signal_types():
     """Test signal type registry."""
-    print("=" * 80)
-    print("Testing Signal Type Registry")
-    print("=" * 80)
-    print()
+    lines = []
+    lines.append("=" * 80)
+    lines.append("Testing Signal Type Registry")
+    lines.append("=" * 80)
+    lines.append("")
 
-    signal_types = get_signal_types()
-    print(f"Total Signal Types: {len(signal_types)}")
-    print()
+    lines.append(f"Total Signal Types: {len(get_signal_types())}")
+    lines.append("")
 
-    for signal_type in signal_types:
-        metadata = get_signal_metadata(signal_type)
-        print(f"✓ {metadata.display_name} ({signal_type.value})")
-        print(f"  Description: {metadata.description}")
-        print(f"  Unit: {metadata.unit}")
+    for signal_type, metadata in SIGNAL_REGISTRY.items():
+        lines.append(f"✓ {metadata.display_name} ({signal_type.value})")
+        lines.append(f"  Description: {metadata.description}")
+        lines.append(f"  Unit: {metadata.unit}")
 
         if metadata.min_value is not None or metadata.max_value is not None:
             min_val = metadata.min_value if metadata.min_value is not None else "-∞"
             max_val = metadata.max_value if metadata.max_value is not None else "∞"
-            print(f"  Range: {min_val} to {max_val}")
+            lines.append(f"  Range: {min_val} to {max_val}")
 
         if metadata.higher_is_better is not None:
             better = "Yes" if metadata.higher_is_better else "No"
-            print(f"  Higher is Better: {better}")
+            lines.append(f"  Higher is Better: {better}")
 
-        print()
+        lines.append("")
 
-    print("=" * 80)
-    print()
+    lines.append("=" * 80)
+    lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def test_validation():
     """Test event and signal type validation."""
-    print("=" * 80)
-    print("Testing Type Validation")
-    print("=" * 80)
-    print()
+    lines = []
+    lines.append("=" * 80)
+    lines.append("Testing Type Validation")
+    lines.append("=" * 80)
+    lines.append("")
 
     # Valid event types
-    print("Valid Event Types:")
+    lines.append("Valid Event Types:")
     valid_events = ["earnings", "product_launch", "acquisition", "regulatory"]
     for event in valid_events:
         is_valid = validate_event_type(event)
         status = "✓" if is_valid else "✗"
-        print(f"  {status} {event}: {is_valid}")
-    print()
+        lines.append(f"  {status} {event}: {is_valid}")
+    lines.append("")
 
     # Invalid event types
-    print("Invalid Event Types:")
+    lines.append("Invalid Event Types:")
     invalid_events = ["invalid", "unknown", "test"]
     for event in invalid_events:
         is_valid = validate_event_type(event)
         status = "✓" if not is_valid else "✗"
-        print(f"  {status} {event}: {is_valid} (expected False)")
-    print()
+        lines.append(f"  {status} {event}: {is_valid} (expected False)")
+    lines.append("")
 
     # Valid signal types
-    print("Valid Signal Types:")
+    lines.append("Valid Signal Types:")
     valid_signals = ["sentiment", "volatility", "volume", "social_engagement"]
     for signal in valid_signals:
         is_valid = validate_signal_type(signal)
         status = "✓" if is_valid else "✗"
-        print(f"  {status} {signal}: {is_valid}")
-    print()
+        lines.append(f"  {status} {signal}: {is_valid}")
+    lines.append("")
 
     # Invalid signal types
-    print("Invalid Signal Types:")
+    lines.append("Invalid Signal Types:")
     invalid_signals = ["invalid", "unknown", "test"]
     for signal in invalid_signals:
         is_valid = validate_signal_type(signal)
         status = "✓" if not is_valid else "✗"
-        print(f"  {status} {signal}: {is_valid} (expected False)")
-    print()
+        lines.append(f"  {status} {signal}: {is_valid} (expected False)")
+    lines.append("")
 
-    print("=" * 80)
-    print()
+    lines.append("=" * 80)
+    lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def test_default_windows():
     """Test default window retrieval."""
-    print("=" * 80)
-    print("Testing Default Windows")
-    print("=" * 80)
-    print()
+    lines = []
+    lines.append("=" * 80)
+    lines.append("Testing Default Windows")
+    lines.append("=" * 80)
+    lines.append("")
 
-    event_types = get_event_types()
+    for event_type, metadata in EVENT_REGISTRY.items():
+        lines.append(f"{metadata.display_name}: {get_default_window(event_type)}")
 
-    for event_type in event_types:
-        window = get_default_window(event_type)
-        metadata = get_event_metadata(event_type)
-        print(f"{metadata.display_name}: {window}")
+    lines.append("")
+    lines.append("=" * 80)
+    lines.append("")
 
-    print()
-    print("=" * 80)
-    print()
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def test_info_lists():
     """Test info listing functions."""
-    print("=" * 80)
-    print("Testing Info Lists (API Format)")
-    print("=" * 80)
-    print()
+    lines = []
+    lines.append("=" * 80)
+    lines.append("Testing Info Lists (API Format)")
+    lines.append("=" * 80)
+    lines.append("")
 
-    print("Event Types Info:")
+    lines.append("Event Types Info:")
     event_info = list_event_types_info()
     for i, info in enumerate(event_info[:3], 1):  # Show first 3
-        print(f"  {i}. {info['display_name']}")
-        print(f"     Type: {info['type']}")
-        print(f"     Frequency: {info['frequency']}")
-        print(f"     Default Window: {info['default_window']}")
-        print()
+        lines.append(f"  {i}. {info.display_name}")
+        lines.append(f"     Type: {info.type}")
+        lines.append(f"     Frequency: {info.frequency}")
+        lines.append(f"     Default Window: {info.default_window}")
+        lines.append("")
 
-    print(f"... and {len(event_info) - 3} more")
-    print()
+    lines.append(f"... and {len(event_info) - 3} more")
+    lines.append("")
 
-    print("Signal Types Info:")
+    lines.append("Signal Types Info:")
     signal_info = list_signal_types_info()
     for i, info in enumerate(signal_info[:3], 1):  # Show first 3
-        print(f"  {i}. {info['display_name']}")
-        print(f"     Type: {info['type']}")
-        print(f"     Unit: {info['unit']}")
-        print(f"     Range: {info['range']}")
-        print()
+        lines.append(f"  {i}. {info.display_name}")
+        lines.append(f"     Type: {info.type}")
+        lines.append(f"     Unit: {info.unit}")
+        lines.append(f"     Range: {info.range}")
+        lines.append("")
 
-    print(f"... and {len(signal_info) - 3} more")
-    print()
+    lines.append(f"... and {len(signal_info) - 3} more")
+    lines.append("")
 
-    print("=" * 80)
-    print()
+    lines.append("=" * 80)
+    lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def test_enum_usage():
     """Test using enums in code."""
-    print("=" * 80)
-    print("Testing Enum Usage")
-    print("=" * 80)
-    print()
+    lines = []
+    lines.append("=" * 80)
+    lines.append("Testing Enum Usage")
+    lines.append("=" * 80)
+    lines.append("")
 
     # Using EventType enum
-    print("Using EventType Enum:")
-    print(f"  EventType.EARNINGS = '{EventType.EARNINGS.value}'")
-    print(f"  EventType.PRODUCT_LAUNCH = '{EventType.PRODUCT_LAUNCH.value}'")
-    print(f"  EventType.ACQUISITION = '{EventType.ACQUISITION.value}'")
-    print()
+    lines.append("Using EventType Enum:")
+    lines.append(f"  EventType.EARNINGS = '{EventType.EARNINGS.value}'")
+    lines.append(f"  EventType.PRODUCT_LAUNCH = '{EventType.PRODUCT_LAUNCH.value}'")
+    lines.append(f"  EventType.ACQUISITION = '{EventType.ACQUISITION.value}'")
+    lines.append("")
 
     # Using SignalType enum
-    print("Using SignalType Enum:")
-    print(f"  SignalType.SENTIMENT = '{SignalType.SENTIMENT.value}'")
-    print(f"  SignalType.VOLATILITY = '{SignalType.VOLATILITY.value}'")
-    print(f"  SignalType.VOLUME = '{SignalType.VOLUME.value}'")
-    print()
+    lines.append("Using SignalType Enum:")
+    lines.append(f"  SignalType.SENTIMENT = '{SignalType.SENTIMENT.value}'")
+    lines.append(f"  SignalType.VOLATILITY = '{SignalType.VOLATILITY.value}'")
+    lines.append(f"  SignalType.VOLUME = '{SignalType.VOLUME.value}'")
+    lines.append("")
 
     # Enum comparison
-    print("Enum Comparisons:")
-    print(f"  EventType.EARNINGS == 'earnings': {EventType.EARNINGS == 'earnings'}")
-    print(f"  SignalType.SENTIMENT == 'sentiment': {SignalType.SENTIMENT == 'sentiment'}")
-    print()
+    lines.append("Enum Comparisons:")
+    lines.append(f"  EventType.EARNINGS == 'earnings': {EventType.EARNINGS == 'earnings'}")
+    lines.append(f"  SignalType.SENTIMENT == 'sentiment': {SignalType.SENTIMENT == 'sentiment'}")
+    lines.append("")
 
-    print("=" * 80)
-    print()
+    lines.append("=" * 80)
+    lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Test script for the content-addressable LLM cache.
+
+Usage (from project root):
+    python3 -m tests.test_llm_cache
+
+    Or with pytest:
+    python3 -m pytest tests/test_llm_cache.py
+"""
+
+import time
+from types import SimpleNamespace
+
+from extract.llm_cache import LLMCache, SemanticCache, make_cache_key
+from extract.llm_entity import (
+    EMBEDDING_MODEL,
+    CompanyEntity,
+    _mentions_entity,
+    extract_company_from_question,
+)
+
+
+def test_cache_keys():
+    """Test that keys are stable and input-sensitive."""
+    print("=" * 80)
+    print("Testing Cache Keys")
+    print("=" * 80)
+
+    a = make_cache_key("extract_company", model="gpt-4o-mini", question="How did NVIDIA do?")
+    b = make_cache_key("extract_company", question="How did NVIDIA do?", model="gpt-4o-mini")
+    c = make_cache_key("extract_company", model="gpt-4o-mini", question="How did Tesla do?")
+
+    status = "✓" if a == b else "✗"
+    print(f"{status} Same inputs (any order) → same key")
+    assert a == b
+
+    status = "✓" if a != c else "✗"
+    print(f"{status} Different question → different key")
+    assert a != c
+
+    print()
+
+
+def test_get_set():
+    """Test round-trip and TTL expiry."""
+    print("=" * 80)
+    print("Testing Cache Get/Set")
+    print("=" * 80)
+
+    cache = LLMCache(":memory:")
+    key = make_cache_key("extract_company", question="nvidia earnings recap")
+    value = {"company_name": "NVIDIA", "ticker": "NVDA", "confidence": 1.0, "reasoning": ""}
+
+    status = "✓" if cache.get(key) is None else "✗"
+    print(f"{status} Miss before set")
+    assert cache.get(key) is None
+
+    cache.set(key, value)
+    status = "✓" if cache.get(key) == value else "✗"
+    print(f"{status} Hit after set: {cache.get(key)}")
+    assert cache.get(key) == value
+
+    cache.set(key, value, ttl=0.01)
+    time.sleep(0.02)
+    status = "✓" if cache.get(key) is None else "✗"
+    print(f"{status} Expired entry treated as miss")
+    assert cache.get(key) is None
+
+    cache.close()
+    print()
+
+
+def test_semantic_lookup():
+    """Test nearest-neighbour lookup against the similarity threshold."""
+    print("=" * 80)
+    print("Testing Semantic Cache Lookup")
+    print("=" * 80)
+
+    cache = SemanticCache(":memory:", threshold=0.92)
+    nvidia = {"company_name": "NVIDIA", "ticker": "NVDA"}
+    cache.add("extract_company", [1.0, 0.0, 0.0], nvidia)
+
+    hit = cache.lookup("extract_company", [0.98, 0.1, 0.0])
+    status = "✓" if hit == nvidia else "✗"
+    print(f"{status} Close embedding → hit: {hit}")
+    assert hit == nvidia
+
+    miss = cache.lookup("extract_company", [0.0, 1.0, 0.0])
+    status = "✓" if miss is None else "✗"
+    print(f"{status} Distant embedding → miss")
+    assert miss is None
+
+    other = cache.lookup("generate_search_query", [1.0, 0.0, 0.0])
+    status = "✓" if other is None else "✗"
+    print(f"{status} Other namespace → miss")
+    assert other is None
+
+    cache.close()
+    print()
+
+
+def test_semantic_expiry_and_eviction():
+    """Test semantic cache TTL and the max_entries cap."""
+    print("=" * 80)
+    print("Testing Semantic Cache Expiry/Eviction")
+    print("=" * 80)
+
+    cache = SemanticCache(":memory:", threshold=0.92, ttl=0.01)
+    cache.add("extract_company", [1.0, 0.0, 0.0], {"ticker": "NVDA"})
+    time.sleep(0.02)
+    expired = cache.lookup("extract_company", [1.0, 0.0, 0.0])
+    status = "✓" if expired is None else "✗"
+    print(f"{status} Expired entry treated as miss")
+    assert expired is None
+    cache.close()
+
+    cache = SemanticCache(":memory:", threshold=0.92, max_entries=10)
+    for i in range(25):
+        cache.add("extract_company", [1.0, float(i), 0.0], i)
+    stored = cache._conn.execute("SELECT COUNT(*) FROM semantic_cache").fetchone()[0]
+    kept = cache._index["extract_company"].values
+    status = "✓" if stored <= 10 and kept == list(range(25 - len(kept), 25)) else "✗"
+    print(f"{status} Capped at max_entries, newest kept: {stored} rows, values {kept}")
+    assert stored <= 10 and len(kept) == stored
+    assert kept == list(range(25 - len(kept), 25))
+
+    newest = cache.lookup("extract_company", [1.0, 24.0, 0.0])
+    status = "✓" if newest == 24 else "✗"
+    print(f"{status} Newest entry still served: {newest}")
+    assert newest == 24
+
+    cache.close()
+    print()
+
+
+class FakeOpenAI:
+    """
+    Stand-in OpenAI client: fixed embeddings per question, and a canned
+    entity from responses.parse. Counts LLM calls so tests can tell cache
+    hits from misses.
+    """
+
+    def __init__(self, embeddings, entity):
+        self.parse_calls = 0
+        self.embeddings = SimpleNamespace(
+            create=lambda model, input: SimpleNamespace(
+                data=[SimpleNamespace(embedding=embeddings[input])]
+            )
+        )
+        self.responses = SimpleNamespace(parse=self._parse)
+        self._entity = entity
+
+    def _parse(self, **kwargs):
+        self.parse_calls += 1
+        return SimpleNamespace(output_parsed=self._entity)
+
+
+def test_mentions_entity():
+    """Test the whole-word guard applied to semantic cache hits."""
+    print("=" * 80)
+    print("Testing Semantic Hit Entity Guard")
+    print("=" * 80)
+
+    cases = [
+        ("How did NVIDIA do in Q3?", CompanyEntity(company_name="NVIDIA", ticker="NVDA"), True),
+        ("What was nvidia's revenue?", CompanyEntity(company_name="NVIDIA", ticker="NVDA"), True),
+        ("Tell me about NVDA", CompanyEntity(company_name="NVIDIA", ticker="NVDA"), True),
+        ("How big is the metaverse?", CompanyEntity(company_name="Meta", ticker="META"), False),
+        ("Did GPU demand slow?", CompanyEntity(company_name=None, ticker="AMD"), False),
+    ]
+
+    for question, entity, expected in cases:
+        result = _mentions_entity(question, entity)
+        status = "✓" if result == expected else "✗"
+        print(f"{status} {question!r} mentions {entity.company_name or entity.ticker}: {result}")
+        assert result == expected
+
+    print()
+
+
+def test_semantic_extraction():
+    """Test extract_company_from_question served through the semantic cache."""
+    print("=" * 80)
+    print("Testing Semantic Cache in Entity Extraction")
+    print("=" * 80)
+
+    nvidia = CompanyEntity(company_name="NVIDIA", ticker="NVDA", confidence=1.0)
+    amd = CompanyEntity(company_name="AMD", ticker="AMD", confidence=1.0)
+    embeddings = {
+        "How did NVIDIA do last quarter?": [0.98, 0.1, 0.0],
+        "How did AMD do last quarter?": [0.97, 0.12, 0.0],
+        "What are the market trends?": [0.0, 0.0, 1.0],
+    }
+
+    def run(question, llm_entity):
+        cache = SemanticCache(":memory:", threshold=0.92)
+        namespace = f"extract_company:gpt-4o-mini:{EMBEDDING_MODEL}"
+        cache.add(namespace, [1.0, 0.0, 0.0], nvidia.model_dump(mode="json"))
+        client = FakeOpenAI(embeddings, llm_entity)
+        entity = extract_company_from_question(
+            client=client, question=question, use_cache=False, semantic_cache=cache
+        )
+        cache.close()
+        return entity, client.parse_calls
+
+    entity, calls = run("How did NVIDIA do last quarter?", amd)
+    status = "✓" if entity.ticker == "NVDA" and calls == 0 else "✗"
+    print(f"{status} Paraphrase → semantic hit without LLM call: {entity.ticker}")
+    assert entity.ticker == "NVDA" and calls == 0
+
+    entity, calls = run("How did AMD do last quarter?", amd)
+    status = "✓" if entity.ticker == "AMD" and calls == 1 else "✗"
+    print(f"{status} Near-duplicate naming another company → rejected, LLM used: {entity.ticker}")
+    assert entity.ticker == "AMD" and calls == 1
+
+    entity, calls = run("What are the market trends?", CompanyEntity())
+    status = "✓" if entity.company_name is None and calls == 1 else "✗"
+    print(f"{status} Distant question → miss, LLM used")
+    assert entity.company_name is None and calls == 1
+
+    print()
+
+
+if __name__ == "__main__":
+    test_cache_keys()
+    test_get_set()
+    test_semantic_lookup()
+    test_semantic_expiry_and_eviction()
+    test_mentions_entity()
+    test_semantic_extraction()
+
+    print("=" * 80)
+    print("All LLM Cache Tests Complete!")
+    print("=" * 80)
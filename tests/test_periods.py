@@ -2,21 +2,18 @@
 """
 Test script for dynamic period calculation utilities.
 
-Usage:
-    python3 tests/test_periods.py
-
-    Or from project root:
+Usage (from project root):
     python3 -m tests.test_periods
-"""
 
-import sys
-from pathlib import Path
+    Run as a module, not by path (python3 tests/test_periods.py cannot import
+    utils). Run this way it prints every case; under pytest only the asserts run.
 
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+    Or with pytest:
+    python3 -m pytest tests/test_periods.py
+"""
 
 from datetime import datetime, timezone
+from utils import periods
 from utils.periods import (
     get_current_quarter,
     get_previous_quarter,
@@ -27,15 +24,25 @@ from utils.periods import (
     get_comparison_period,
     get_default_periods,
     get_period_offset,
+    get_period_offsets_batch,
+    get_trailing_periods,
     validate_period,
 )
 
+# Detailed output only when run as a script; under pytest only the asserts run
+VERBOSE = __name__ == "__main__"
+
+
+def log(*args) -> None:
+    if VERBOSE:
+        print(*args)
+
 
 def test_current_quarter():
     """Test current quarter detection."""
-    print("=" * 80)
-    print("Testing Current Quarter Detection")
-    print("=" * 80)
+    log("=" * 80)
+    log("Testing Current Quarter Detection")
+    log("=" * 80)
 
     # Test specific dates
     test_cases = [
@@ -50,19 +57,21 @@ def test_current_quarter():
         q, y = get_current_quarter(dt)
         period_str = format_period(q, y)
         status = "✓" if (q, y) == expected_qy else "✗"
-        print(f"{status} {dt.strftime('%Y-%m-%d')}: Q{q}-{y} (expected {expected_str})")
+        log(f"{status} {dt.strftime('%Y-%m-%d')}: Q{q}-{y} (expected {expected_str})")
+        assert (q, y) == expected_qy, f"{dt:%Y-%m-%d}: got Q{q}-{y}, expected {expected_str}"
+        assert period_str == expected_str
 
-    print()
+    log()
 
 
 def test_quarter_navigation():
     """Test previous/next quarter calculation."""
-    print("=" * 80)
-    print("Testing Quarter Navigation")
-    print("=" * 80)
+    log("=" * 80)
+    log("Testing Quarter Navigation")
+    log("=" * 80)
 
     # Test previous quarter
-    print("\nPrevious Quarter:")
+    log("\nPrevious Quarter:")
     test_cases = [
         ((1, 2025), (4, 2024)),
         ((2, 2025), (1, 2025)),
@@ -73,10 +82,11 @@ def test_quarter_navigation():
     for (q, y), (exp_q, exp_y) in test_cases:
         prev_q, prev_y = get_previous_quarter(q, y)
         status = "✓" if (prev_q, prev_y) == (exp_q, exp_y) else "✗"
-        print(f"{status} Q{q}-{y} → Q{prev_q}-{prev_y} (expected Q{exp_q}-{exp_y})")
+        log(f"{status} Q{q}-{y} → Q{prev_q}-{prev_y} (expected Q{exp_q}-{exp_y})")
+        assert (prev_q, prev_y) == (exp_q, exp_y), f"previous of Q{q}-{y}"
 
     # Test next quarter
-    print("\nNext Quarter:")
+    log("\nNext Quarter:")
     test_cases = [
         ((1, 2025), (2, 2025)),
         ((2, 2025), (3, 2025)),
@@ -87,19 +97,20 @@ def test_quarter_navigation():
     for (q, y), (exp_q, exp_y) in test_cases:
         next_q, next_y = get_next_quarter(q, y)
         status = "✓" if (next_q, next_y) == (exp_q, exp_y) else "✗"
-        print(f"{status} Q{q}-{y} → Q{next_q}-{next_y} (expected Q{exp_q}-{exp_y})")
+        log(f"{status} Q{q}-{y} → Q{next_q}-{next_y} (expected Q{exp_q}-{exp_y})")
+        assert (next_q, next_y) == (exp_q, exp_y), f"next of Q{q}-{y}"
 
-    print()
+    log()
 
 
 def test_period_parsing():
     """Test period string parsing and formatting."""
-    print("=" * 80)
-    print("Testing Period Parsing and Formatting")
-    print("=" * 80)
+    log("=" * 80)
+    log("Testing Period Parsing and Formatting")
+    log("=" * 80)
 
     # Test valid periods
-    print("\nValid Periods:")
+    log("\nValid Periods:")
     valid_cases = [
         "Q1-2025",
         "Q2-2025",
@@ -112,10 +123,12 @@ def test_period_parsing():
         q, y = parse_period(period)
         reconstructed = format_period(q, y)
         status = "✓" if reconstructed == period else "✗"
-        print(f"{status} {period} → Q{q}, {y} → {reconstructed}")
+        log(f"{status} {period} → Q{q}, {y} → {reconstructed}")
+        assert reconstructed == period
+        assert validate_period(period)
 
     # Test invalid periods
-    print("\nInvalid Periods:")
+    log("\nInvalid Periods:")
     invalid_cases = [
         "Q5-2025",
         "2025-Q3",
@@ -127,16 +140,17 @@ def test_period_parsing():
     for period in invalid_cases:
         is_valid = validate_period(period)
         status = "✓" if not is_valid else "✗"
-        print(f"{status} {period} → Valid: {is_valid} (expected False)")
+        log(f"{status} {period} → Valid: {is_valid} (expected False)")
+        assert not is_valid, f"{period} should be invalid"
 
-    print()
+    log()
 
 
 def test_default_periods():
     """Test default period calculation."""
-    print("=" * 80)
-    print("Testing Default Period Calculation")
-    print("=" * 80)
+    log("=" * 80)
+    log("Testing Default Period Calculation")
+    log("=" * 80)
 
     test_dates = [
         datetime(2025, 1, 15, tzinfo=timezone.utc),   # Q1-2025
@@ -150,59 +164,116 @@ def test_default_periods():
         latest = get_latest_period(dt)
         comparison = get_comparison_period(dt, periods_back=1)
 
-        print(f"\nDate: {dt.strftime('%Y-%m-%d')}")
-        print(f"  Latest Period (period_a): {period_a}")
-        print(f"  Comparison Period (period_b): {period_b}")
-        print(f"  Matches get_latest_period: {period_a == latest}")
-        print(f"  Matches get_comparison_period: {period_b == comparison}")
+        log(f"\nDate: {dt.strftime('%Y-%m-%d')}")
+        log(f"  Latest Period (period_a): {period_a}")
+        log(f"  Comparison Period (period_b): {period_b}")
+        log(f"  Matches get_latest_period: {period_a == latest}")
+        log(f"  Matches get_comparison_period: {period_b == comparison}")
+        assert period_a == latest
+        assert period_b == comparison
+        assert period_b == get_period_offset(period_a, -1)
 
-    print()
+    log()
 
 
 def test_period_offset():
     """Test period offset calculation."""
-    print("=" * 80)
-    print("Testing Period Offset")
-    print("=" * 80)
+    log("=" * 80)
+    log("Testing Period Offset")
+    log("=" * 80)
 
     base_period = "Q3-2025"
 
-    print(f"\nBase Period: {base_period}\n")
+    log(f"\nBase Period: {base_period}\n")
 
     offsets = [-3, -2, -1, 0, 1, 2, 3]
+    expected_offsets = {
+        -3: "Q4-2024",
+        -2: "Q1-2025",
+        -1: "Q2-2025",
+        0: "Q3-2025",
+        1: "Q4-2025",
+        2: "Q1-2026",
+        3: "Q2-2026",
+    }
 
     for offset in offsets:
         result = get_period_offset(base_period, offset)
         direction = "back" if offset < 0 else "forward" if offset > 0 else "same"
-        print(f"  Offset {offset:+2d} ({direction:7s}): {result}")
+        log(f"  Offset {offset:+2d} ({direction:7s}): {result}")
+        assert result == expected_offsets[offset], f"offset {offset:+d}"
+
+    batch = get_period_offsets_batch(base_period, offsets)
+    expected = [get_period_offset(base_period, offset) for offset in offsets]
+    status = "✓" if batch == expected else "✗"
+    log(f"\n{status} Batch offsets match single offsets: {batch}")
+    assert batch == expected
+
+    # Arbitrary offsets must not grow the interning cache without bound
+    wide = get_period_offsets_batch(base_period, range(-3000, 3000))
+    cache_size = len(periods._PERIOD_STR_CACHE)
+    status = "✓" if cache_size <= periods._PERIOD_STR_CACHE_MAX else "✗"
+    log(f"{status} Interned periods capped: {cache_size} <= {periods._PERIOD_STR_CACHE_MAX}")
+    assert cache_size <= periods._PERIOD_STR_CACHE_MAX
+    assert wide[0] == "Q3-1275" and wide[-1] == "Q2-2775"
 
-    print()
+    log()
+
+
+def test_trailing_periods():
+    """Test trailing period windows, including year rollover."""
+    log("=" * 80)
+    log("Testing Trailing Periods")
+    log("=" * 80)
+
+    test_cases = [
+        (datetime(2026, 2, 1, tzinfo=timezone.utc), 4, ["Q1-2026", "Q4-2025", "Q3-2025", "Q2-2025"]),
+        (datetime(2025, 11, 20, tzinfo=timezone.utc), 6,
+         ["Q4-2025", "Q3-2025", "Q2-2025", "Q1-2025", "Q4-2024", "Q3-2024"]),
+        (datetime(2025, 7, 20, tzinfo=timezone.utc), 1, ["Q3-2025"]),
+        (datetime(2025, 7, 20, tzinfo=timezone.utc), 0, []),
+        (datetime(2025, 7, 20, tzinfo=timezone.utc), -2, []),
+    ]
+
+    for dt, n, expected in test_cases:
+        result = get_trailing_periods(n, dt)
+        status = "✓" if result == expected else "✗"
+        log(f"{status} {dt.strftime('%Y-%m-%d')}, n={n}: {result}")
+        assert result == expected, f"{dt:%Y-%m-%d}, n={n}"
+
+    log()
 
 
 def test_current_system():
     """Test with current system time."""
-    print("=" * 80)
-    print("Testing with Current System Time")
-    print("=" * 80)
+    log("=" * 80)
+    log("Testing with Current System Time")
+    log("=" * 80)
 
     now = datetime.now(timezone.utc)
     q, y = get_current_quarter()
     period_a, period_b = get_default_periods()
 
-    print(f"\nCurrent UTC Time: {now.strftime('%Y-%m-%d %H:%M:%S %Z')}")
-    print(f"Current Quarter: Q{q}-{y}")
-    print(f"API Default Periods:")
-    print(f"  period_a (latest): {period_a}")
-    print(f"  period_b (comparison): {period_b}")
-    print()
+    log(f"\nCurrent UTC Time: {now.strftime('%Y-%m-%d %H:%M:%S %Z')}")
+    log(f"Current Quarter: Q{q}-{y}")
+    log(f"API Default Periods:")
+    log(f"  period_a (latest): {period_a}")
+    log(f"  period_b (comparison): {period_b}")
+    assert period_a == format_period(q, y)
+    assert period_b == get_period_offset(period_a, -1)
+    log()
 
     # Show comparison periods
-    print("Comparison Periods (quarters back):")
+    log("Comparison Periods (quarters back):")
+    trailing = get_trailing_periods(6)
+    assert trailing[0] == period_a
     for i in range(1, 6):
-        comp = get_comparison_period(periods_back=i)
-        print(f"  {i} quarter(s) back: {comp}")
+        comp = trailing[i]
+        log(f"  {i} quarter(s) back: {comp}")
+        assert comp == get_comparison_period(periods_back=i)
+        assert comp == get_period_offset(period_a, -i)
 
-    print()
+    log()
 
 
 if __name__ == "__main__":
@@ -211,6 +282,7 @@ if __name__ == "__main__":
     test_period_parsing()
     test_default_periods()
     test_period_offset()
+    test_trailing_periods()
     test_current_system()
 
     print("=" * 80)
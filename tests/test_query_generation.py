@@ -2,29 +2,19 @@
 """
 Test script for LLM-based search query generation.
 
-Usage:
-    python3 tests/test_query_generation.py
-
-    Or from project root:
+Usage (from project root):
     python3 -m tests.test_query_generation
-"""
 
-import sys
-from pathlib import Path
-
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+    Or with pytest (skipped without OPENAI_API_KEY):
+    python3 -m pytest tests/test_query_generation.py
+"""
 
-from openai import OpenAI
 from ingest.llm_query_gen import generate_search_query, generate_multi_source_queries
 
 
-def test_basic_query_generation():
+def test_basic_query_generation(client):
     """Test basic query generation for different scenarios."""
 
-    client = OpenAI()
-
     print("=" * 80)
     print("Testing LLM-Based Search Query Generation")
     print("=" * 80)
@@ -104,11 +94,9 @@ def test_basic_query_generation():
         print()
 
 
-def test_multi_source_queries():
+def test_multi_source_queries(client):
     """Test generating queries for multiple source types."""
 
-    client = OpenAI()
-
     print("=" * 80)
     print("Testing Multi-Source Query Generation")
     print("=" * 80)
@@ -139,11 +127,9 @@ def test_multi_source_queries():
     print("=" * 80)
 
 
-def test_query_comparison():
+def test_query_comparison(client):
     """Compare old hardcoded vs new LLM-based queries."""
 
-    client = OpenAI()
-
     print("=" * 80)
     print("Comparison: Hardcoded vs LLM-Generated Queries")
     print("=" * 80)
@@ -192,11 +178,9 @@ def test_query_comparison():
     print("=" * 80)
 
 
-def test_event_types():
+def test_event_types(client):
     """Test query generation for different event types."""
 
-    client = OpenAI()
-
     print("=" * 80)
     print("Testing Different Event Types")
     print("=" * 80)
@@ -227,14 +211,18 @@ def test_event_types():
 
 
 if __name__ == "__main__":
+    from openai import OpenAI
+
+    client = OpenAI()
+
     print()
-    test_basic_query_generation()
+    test_basic_query_generation(client)
     print()
-    test_multi_source_queries()
+    test_multi_source_queries(client)
     print()
-    test_query_comparison()
+    test_query_comparison(client)
     print()
-    test_event_types()
+    test_event_types(client)
     print()
     print("=" * 80)
     print("All Query Generation Tests Complete!")
@@ -8,10 +8,15 @@ from .periods import (
     parse_period,
     get_latest_period,
     get_comparison_period,
+    get_trailing_periods,
     get_default_periods,
     get_period_offset,
+    get_period_offsets_batch,
     validate_period,
-    FiscalQuarter,
+    Q1,
+    Q2,
+    Q3,
+    Q4,
 )
 
 __all__ = [
@@ -22,8 +27,13 @@ __all__ = [
     "parse_period",
     "get_latest_period",
     "get_comparison_period",
+    "get_trailing_periods",
     "get_default_periods",
     "get_period_offset",
+    "get_period_offsets_batch",
     "validate_period",
-    "FiscalQuarter",
+    "Q1",
+    "Q2",
+    "Q3",
+    "Q4",
 ]
@@ -7,17 +7,61 @@ dynamically based on the current date, eliminating hardcoded period values.
 
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone
-from typing import Tuple, Optional
-from enum import Enum
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple, Optional
 
 
-class FiscalQuarter(Enum):
-    """Fiscal quarter enumeration."""
-    Q1 = 1
-    Q2 = 2
-    Q3 = 3
-    Q4 = 4
+# Standard calendar quarters, indexed by month (index 0 unused)
+_MONTH_TO_Q = (0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4)
+
+# Current-quarter clock cache (see _now_idx)
+_NOW_TTL_SECONDS = 60.0
+_now_idx_value = -1
+_now_checked_at = 0.0
+
+# One shared string per formatted (quarter, year); capped like _try_parse's
+# lru_cache, past which periods are formatted without being interned
+_PERIOD_STR_CACHE_MAX = 1024
+_PERIOD_STR_CACHE: Dict[Tuple[int, int], str] = {}
+
+
+# Fiscal quarter numbers, as accepted and returned by the functions below
+Q1, Q2, Q3, Q4 = 1, 2, 3, 4
+
+
+def _pack(quarter: int, year: int) -> int:
+    """Encode (quarter, year) as quarters since year 0, so offsets are plain adds."""
+    return year * 4 + quarter - 1
+
+
+def _unpack(idx: int) -> Tuple[int, int]:
+    """Inverse of _pack: quarters since year 0 -> (quarter, year)."""
+    year, q0 = divmod(idx, 4)
+    return q0 + 1, year
+
+
+def _current_idx(dt: Optional[datetime] = None) -> int:
+    """Packed index of the quarter containing dt (default: now, UTC)."""
+    if dt is None:
+        return _now_idx()
+    return _pack(_MONTH_TO_Q[dt.month], dt.year)
+
+
+def _now_idx() -> int:
+    """
+    Packed index of the current UTC quarter, re-read from the clock at most
+    every _NOW_TTL_SECONDS. Quarters change four times a year, so the answer
+    may lag a boundary by that long.
+    """
+    global _now_idx_value, _now_checked_at
+
+    t = time.monotonic()
+    if _now_idx_value < 0 or t - _now_checked_at > _NOW_TTL_SECONDS:
+        _now_idx_value = _current_idx(datetime.now(timezone.utc))
+        _now_checked_at = t
+    return _now_idx_value
 
 
 def get_current_quarter(dt: Optional[datetime] = None) -> Tuple[int, int]:
@@ -37,21 +81,9 @@ def get_current_quarter(dt: Optional[datetime] = None) -> Tuple[int, int]:
         (4, 2025)  # Q4-2025
     """
     if dt is None:
-        dt = datetime.now(timezone.utc)
-
-    month = dt.month
-
-    # Standard calendar quarters
-    if 1 <= month <= 3:
-        quarter = 1
-    elif 4 <= month <= 6:
-        quarter = 2
-    elif 7 <= month <= 9:
-        quarter = 3
-    else:  # 10-12
-        quarter = 4
+        return _unpack(_now_idx())
 
-    return quarter, dt.year
+    return _MONTH_TO_Q[dt.month], dt.year
 
 
 def get_previous_quarter(quarter: int, year: int) -> Tuple[int, int]:
@@ -71,10 +103,7 @@ def get_previous_quarter(quarter: int, year: int) -> Tuple[int, int]:
         >>> get_previous_quarter(3, 2025)
         (2, 2025)  # Q2-2025
     """
-    if quarter == 1:
-        return (4, year - 1)
-    else:
-        return (quarter - 1, year)
+    return _unpack(_pack(quarter, year) - 1)
 
 
 def get_next_quarter(quarter: int, year: int) -> Tuple[int, int]:
@@ -94,10 +123,7 @@ def get_next_quarter(quarter: int, year: int) -> Tuple[int, int]:
         >>> get_next_quarter(2, 2025)
         (3, 2025)  # Q3-2025
     """
-    if quarter == 4:
-        return (1, year + 1)
-    else:
-        return (quarter + 1, year)
+    return _unpack(_pack(quarter, year) + 1)
 
 
 def format_period(quarter: int, year: int) -> str:
@@ -115,10 +141,44 @@ def format_period(quarter: int, year: int) -> str:
         >>> format_period(3, 2025)
         'Q3-2025'
     """
+    key = (quarter, year)
+    period = _PERIOD_STR_CACHE.get(key)
+    if period is not None:
+        return period
+
     if not 1 <= quarter <= 4:
         raise ValueError(f"Quarter must be 1-4, got {quarter}")
 
-    return f"Q{quarter}-{year}"
+    period = f"Q{quarter}-{year}"
+    if len(_PERIOD_STR_CACHE) < _PERIOD_STR_CACHE_MAX:
+        _PERIOD_STR_CACHE[key] = period
+    return period
+
+
+def _is_well_formed(period: str) -> bool:
+    """Check the fixed "Q<1-4>-<year>" layout by character position."""
+    year_str = period[3:]
+    return (
+        len(period) >= 7
+        and period[0] == "Q"
+        and period[2] == "-"
+        and "1" <= period[1] <= "4"
+        and year_str.isascii()
+        and year_str.isdigit()
+    )
+
+
+@lru_cache(maxsize=1024)
+def _try_parse(period: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse a period string, returning None instead of raising when invalid.
+
+    Periods come from a small vocabulary, so results (including misses)
+    are memoized.
+    """
+    if not _is_well_formed(period):
+        return None
+    return ord(period[1]) - 48, int(period[3:])
 
 
 def parse_period(period: str) -> Tuple[int, int]:
@@ -138,25 +198,10 @@ def parse_period(period: str) -> Tuple[int, int]:
         >>> parse_period("Q3-2025")
         (3, 2025)
     """
-    try:
-        parts = period.split("-")
-        if len(parts) != 2:
-            raise ValueError(f"Invalid period format: {period}")
-
-        quarter_str = parts[0]
-        if not quarter_str.startswith("Q"):
-            raise ValueError(f"Period must start with 'Q': {period}")
-
-        quarter = int(quarter_str[1:])
-        year = int(parts[1])
-
-        if not 1 <= quarter <= 4:
-            raise ValueError(f"Quarter must be 1-4: {period}")
-
-        return quarter, year
-
-    except (IndexError, ValueError) as e:
-        raise ValueError(f"Invalid period format '{period}'. Expected 'Q[1-4]-YYYY'") from e
+    parsed = _try_parse(period)
+    if parsed is None:
+        raise ValueError(f"Invalid period format '{period}'. Expected 'Q[1-4]-YYYY'")
+    return parsed
 
 
 def get_latest_period(dt: Optional[datetime] = None) -> str:
@@ -176,8 +221,7 @@ def get_latest_period(dt: Optional[datetime] = None) -> str:
         >>> get_latest_period()
         'Q4-2025'
     """
-    quarter, year = get_current_quarter(dt)
-    return format_period(quarter, year)
+    return format_period(*_unpack(_current_idx(dt)))
 
 
 def get_comparison_period(dt: Optional[datetime] = None, periods_back: int = 1) -> str:
@@ -198,12 +242,30 @@ def get_comparison_period(dt: Optional[datetime] = None, periods_back: int = 1)
         >>> get_comparison_period(periods_back=2)
         'Q2-2025'
     """
-    quarter, year = get_current_quarter(dt)
+    return format_period(*_unpack(_current_idx(dt) - periods_back))
+
+
+def get_trailing_periods(n: int, dt: Optional[datetime] = None) -> List[str]:
+    """
+    Get the last N periods, most recent first, ending with the current period.
 
-    for _ in range(periods_back):
-        quarter, year = get_previous_quarter(quarter, year)
+    Equivalent to [get_comparison_period(dt, periods_back=i) for i in range(n)],
+    but the current quarter is resolved only once.
 
-    return format_period(quarter, year)
+    Args:
+        n: Number of periods to return (n <= 0 gives an empty list)
+        dt: Optional datetime to use. If None, uses current UTC time.
+
+    Returns:
+        List of n period strings (e.g., ["Q4-2025", "Q3-2025", ...])
+
+    Example:
+        >>> # If current date is November 2025 (Q4-2025)
+        >>> get_trailing_periods(3)
+        ['Q4-2025', 'Q3-2025', 'Q2-2025']
+    """
+    base = _current_idx(dt)
+    return [format_period(*_unpack(base - i)) for i in range(n)]
 
 
 def get_default_periods(dt: Optional[datetime] = None) -> Tuple[str, str]:
@@ -223,9 +285,9 @@ def get_default_periods(dt: Optional[datetime] = None) -> Tuple[str, str]:
         >>> get_default_periods()
         ('Q4-2025', 'Q3-2025')
     """
-    period_a = get_latest_period(dt)
-    period_b = get_comparison_period(dt, periods_back=1)
-    return period_a, period_b
+    # Resolve the quarter once and derive both periods from it
+    idx = _current_idx(dt)
+    return format_period(*_unpack(idx)), format_period(*_unpack(idx - 1))
 
 
 def get_period_offset(period: str, offset: int) -> str:
@@ -245,20 +307,34 @@ def get_period_offset(period: str, offset: int) -> str:
         >>> get_period_offset("Q3-2025", 2)
         'Q1-2026'
     """
-    quarter, year = parse_period(period)
+    idx = _pack(*parse_period(period))
 
     if offset == 0:
         return period
 
-    # Apply offset
-    if offset > 0:
-        for _ in range(offset):
-            quarter, year = get_next_quarter(quarter, year)
-    else:
-        for _ in range(abs(offset)):
-            quarter, year = get_previous_quarter(quarter, year)
+    return format_period(*_unpack(idx + offset))
 
-    return format_period(quarter, year)
+
+def get_period_offsets_batch(period: str, offsets: Iterable[int]) -> List[str]:
+    """
+    Offset one base period by many quarter offsets at once.
+
+    Equivalent to [get_period_offset(period, o) for o in offsets], but the
+    base period is parsed only once.
+
+    Args:
+        period: Base period string (e.g., "Q3-2025")
+        offsets: Quarter offsets (positive = future, negative = past)
+
+    Returns:
+        List of offset period strings, in the order of offsets
+
+    Example:
+        >>> get_period_offsets_batch("Q3-2025", [-1, 0, 2])
+        ['Q2-2025', 'Q3-2025', 'Q1-2026']
+    """
+    idx = _pack(*parse_period(period))
+    return [format_period(*_unpack(idx + offset)) for offset in offsets]
 
 
 def validate_period(period: str) -> bool:
@@ -279,8 +355,6 @@ def validate_period(period: str) -> bool:
         >>> validate_period("2025-Q3")
         False
     """
-    try:
-        parse_period(period)
-        return True
-    except ValueError:
-        return False
+    # Character checks only: no parse, no exception, and arbitrary invalid
+    # input never lands in the parse cache
+    return isinstance(period, str) and _is_well_formed(period)